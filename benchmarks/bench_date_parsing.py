@@ -0,0 +1,84 @@
+"""
+Compare CSV ingestion with the old per-row strptime against the shared,
+memoized date parser in src/dates.py.
+
+Run from the repository root:
+
+    python benchmarks/bench_date_parsing.py [rows]
+"""
+import csv
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.datastore import RaceDataStore
+from src.dates import parse_race_date, parse_race_datetime
+
+
+def write_season(path: Path, rows: int):
+    # a realistic season: ~36 race weekends, many entries per race
+    dates = [f"2024-{month:02d}-{day:02d}" for month in range(2, 11) for day in (3, 10, 17, 24)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["race_id", "date", "circuit", "driver", "team"])
+        for i in range(rows):
+            race = i % len(dates)
+            writer.writerow([race, dates[race], f"Circuit {race}", f"Driver {i % 40}", f"Team {i % 12}"])
+
+
+def best_of(repeats: int, fn) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "season.csv"
+        write_season(path, rows)
+        with open(path, encoding="utf-8") as f:
+            date_strings = [row["date"] for row in csv.DictReader(f)]
+
+        def strptime_only():
+            for s in date_strings:
+                datetime.strptime(s, "%Y-%m-%d")
+
+        def shared_parser():
+            parse_race_date.cache_clear()
+            for s in date_strings:
+                parse_race_date(s)
+
+        def ingest():
+            parse_race_datetime.cache_clear()
+            parse_race_date.cache_clear()
+            RaceDataStore().load_race_data(str(path))
+
+        old = best_of(3, strptime_only)
+        new = best_of(3, shared_parser)
+        print(f"{rows} date strings")
+        print(f"  strptime per row:   {old:.3f}s")
+        print(f"  parse_race_date:    {new:.3f}s  ({old / new:.1f}x)")
+
+        # full ingestion, with the old parser swapped back in for comparison
+        import src.datastore as datastore
+        fast = best_of(3, ingest)
+        datastore.parse_race_datetime = lambda s: datetime.strptime(s, "%Y-%m-%d")
+        try:
+            slow = best_of(3, ingest)
+        finally:
+            datastore.parse_race_datetime = parse_race_datetime
+        print(f"load_race_data on {rows} rows")
+        print(f"  strptime per row:   {slow:.3f}s")
+        print(f"  shared parser:      {fast:.3f}s  ({slow / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure what load_many's worker processes send back to the parent, and
+the end-to-end load time for one worker against a process pool.
+
+Workers used to pickle lists of RaceResult objects; the parent then
+unpickled every file serially, which cost more than the parsing that was
+being spread across cores. They now send dictionary-encoded columns
+(see _read_race_columns) and the parent builds the objects once.
+
+Run from the repository root:
+
+    python benchmarks/bench_load_many.py [files] [rows_per_file] [workers]
+"""
+import csv
+import os
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.datastore import RaceDataStore, _read_race_columns, _read_race_file, _results_from_columns
+
+
+def write_file(path: Path, rows: int, offset: int):
+    dates = [f"2024-{month:02d}-{day:02d}" for month in range(2, 11) for day in (3, 10, 17, 24)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["race_id", "date", "circuit", "driver", "team"])
+        for i in range(rows):
+            race = (i + offset) % len(dates)
+            writer.writerow([race, dates[race], f"Circuit {race}", f"Driver {i % 40}", f"Team {i % 12}"])
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 60_000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in range(files):
+            path = Path(tmp) / f"part{n}.csv"
+            write_file(path, rows, n)
+            paths.append(str(path))
+
+        # per-file cost of getting one parsed file into the parent
+        objects = _read_race_file(paths[0])
+        dumped, dump_objects = timed(lambda: pickle.dumps(objects, pickle.HIGHEST_PROTOCOL))
+        _, load_objects = timed(lambda: pickle.loads(dumped))
+        columns = _read_race_columns(paths[0])
+        packed, dump_columns = timed(lambda: pickle.dumps(columns, pickle.HIGHEST_PROTOCOL))
+        _, load_columns = timed(lambda: _results_from_columns(pickle.loads(packed)))
+        print(f"one file of {rows} rows sent back from a worker")
+        print(f"  RaceResult objects: {len(dumped) / 1e6:6.1f} MB, worker dump {dump_objects:.3f}s, "
+              f"parent load {load_objects:.3f}s")
+        print(f"  encoded columns:    {len(packed) / 1e6:6.1f} MB, worker dump {dump_columns:.3f}s, "
+              f"parent load + build {load_columns:.3f}s")
+
+        _, serial = timed(lambda: RaceDataStore().load_many(paths, workers=1))
+        _, pooled = timed(lambda: RaceDataStore().load_many(paths, workers=workers))
+        print(f"load_many on {files} files x {rows} rows ({os.cpu_count()} CPUs)")
+        print(f"  workers=1:  {serial:.3f}s")
+        print(f"  workers={workers}:  {pooled:.3f}s  ({serial / pooled:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
 from .datastore import RaceDataStore
+from .columnar import ColumnarRaceDataStore
 # from .driver_profile import DriverProfile
 
@@ -1,10 +1,65 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Iterable
-from collections import defaultdict
+from typing import Iterable, NamedTuple
+from collections import defaultdict, deque
+from operator import itemgetter
+import heapq
 from datetime import datetime
 import csv
 
+from .analytics import QuantileSketch
+from .dates import parse_race_date
+
+
+class TrendPoint(NamedTuple):
+    date: str
+    time: float
+    moving_average: float
+    ewma: float
+    delta: float | None     # change from the previous race; negative is faster
+    streak: int             # +n: n straight races faster, -n: n straight slower
+
+
+class _DriverTrend:
+    """Rolling moving average, EWMA and streak for one driver, updated per race."""
+
+    def __init__(self, window: int, alpha: float):
+        self.window = window
+        self.alpha = alpha
+        self.points: list[TrendPoint] = []
+        self.last_date: datetime | None = None
+        self._recent: deque[float] = deque()
+        self._recent_sum = 0.0
+
+    def add(self, date: datetime, date_str: str, time: float):
+        self._recent.append(time)
+        self._recent_sum += time
+        if len(self._recent) > self.window:
+            self._recent_sum -= self._recent.popleft()
+
+        previous = self.points[-1] if self.points else None
+        if previous is None:
+            ewma, delta, streak = time, None, 0
+        else:
+            ewma = self.alpha * time + (1 - self.alpha) * previous.ewma
+            delta = time - previous.time
+            if delta < 0:
+                streak = previous.streak + 1 if previous.streak > 0 else 1
+            elif delta > 0:
+                streak = previous.streak - 1 if previous.streak < 0 else -1
+            else:
+                streak = 0
+
+        self.points.append(TrendPoint(
+            date=date_str,
+            time=time,
+            moving_average=self._recent_sum / len(self._recent),
+            ewma=ewma,
+            delta=delta,
+            streak=streak,
+        ))
+        self.last_date = date
+
 
 class MotorsportAnalytics:
     """
@@ -14,11 +69,15 @@ class MotorsportAnalytics:
     performance, list top drivers, and analyze trends over time.
     """
 
-    def __init__(self, data_source: str | Path):
+    def __init__(self, data_source: str | Path, trend_window: int = 3, trend_alpha: float = 0.3):
         # Validate data source
         path = Path(data_source)
         if not path.exists():
             raise FileNotFoundError(f"Data file not found: {path}")
+        if trend_window < 1:
+            raise ValueError("trend_window must be at least 1")
+        if not 0 < trend_alpha <= 1:
+            raise ValueError("trend_alpha must be in (0, 1]")
 
         self._data_source = path       # private attribute for file path
         self._rows: list[dict] = self._load_csv(path)  # private attribute for race data
@@ -26,6 +85,27 @@ class MotorsportAnalytics:
         if not self._rows:
             raise ValueError("No race data found in the file.")
 
+        # typed columns, one entry per row, converted once here so the
+        # analysis methods never re-parse names, times or dates
+        self._names: list[str] = []
+        self._teams: list[str] = []
+        self._circuits: list[str] = []      # empty when the CSV has no Circuit column
+        self._date_strings: list[str] = []
+        self._dates: list[datetime | None] = []
+        self._times: list[float | None] = []
+        # lower-cased driver name -> row numbers
+        self._driver_index: dict[str, list[int]] = defaultdict(list)
+        self._add_rows(self._rows)
+
+        # leaderboard results, reused until the data changes
+        self._leaderboards: dict[tuple, list] = {}
+
+        # rolling trend state per lower-cased driver name, built on first
+        # request and then updated as results are appended
+        self._trend_window = trend_window
+        self._trend_alpha = trend_alpha
+        self._trends: dict[str, _DriverTrend] = {}
+
     # Properties for Encapsulation
 
     @property
@@ -38,33 +118,72 @@ class MotorsportAnalytics:
         # Return a safe copy of the race data
         return list(self._rows)
 
+    # Adding Data
+
+    def add_results(self, rows: Iterable[dict]) -> int:
+        # Append new result rows (same columns as the CSV) and keep the
+        # leaderboards and rolling trends current; returns rows added
+        rows = list(rows)
+        first = len(self._names)
+        self._rows.extend(rows)
+        self._add_rows(rows)
+        self._leaderboards.clear()
+
+        for i in range(first, len(self._names)):
+            trend = self._trends.get(self._names[i].lower())
+            if trend is None or self._dates[i] is None or self._times[i] is None:
+                continue
+            if trend.last_date is not None and self._dates[i] < trend.last_date:
+                # an older result arrived late; rebuild this driver on next request
+                del self._trends[self._names[i].lower()]
+            else:
+                trend.add(self._dates[i], self._date_strings[i], self._times[i])
+        return len(rows)
+
     # Private Helper Methods
     def _load_csv(self, path: Path) -> list[dict]:
         # Load race data from a CSV file
         with open(path, encoding="utf-8") as f:
             return list(csv.DictReader(f))
 
-    @staticmethod
-    def _calculate_average_finish(times: Iterable[float]) -> float:
-        # Compute the average finish time from a list of numeric values
-        values = [float(t) for t in times if str(t).strip()]
-        if not values:
-            raise ValueError("No valid finish times provided.")
-        return sum(values) / len(values)
+    def _add_rows(self, rows: Iterable[dict]):
+        # Convert raw CSV rows into the typed columns and driver index
+        for r in rows:
+            name = str(r.get("Driver Name", "")).strip()
+            date_str = str(r.get("Race Date", "")).strip()
+            try:
+                date = parse_race_date(date_str)
+            except ValueError:
+                date = None
+            try:
+                time = float(r["Finish Time"])
+            except (KeyError, TypeError, ValueError):
+                time = None
+
+            self._driver_index[name.lower()].append(len(self._names))
+            self._names.append(name)
+            self._teams.append(str(r.get("Team", "")).strip())
+            self._circuits.append(str(r.get("Circuit") or "").strip())
+            self._date_strings.append(date_str)
+            self._dates.append(date)
+            self._times.append(time)
+
+    def _driver_times(self, driver_name: str) -> tuple[list[int], list[float]]:
+        # Row numbers and valid finish times for one driver
+        rows = self._driver_index.get(driver_name.strip().lower(), [])
+        times = [self._times[i] for i in rows if self._times[i] is not None]
+        return rows, times
 
     # Core Instance Methods
 
 
     def compare_drivers(self, driver1: str, driver2: str) -> dict:
         # Compare two drivers' average finish times and determine the better one
-        d1_rows = [r for r in self._rows if r["Driver Name"].lower() == driver1.lower()]
-        d2_rows = [r for r in self._rows if r["Driver Name"].lower() == driver2.lower()]
+        d1_rows, d1_times = self._driver_times(driver1)
+        d2_rows, d2_times = self._driver_times(driver2)
 
-        d1_times = [float(r["Finish Time"]) for r in d1_rows if r.get("Finish Time")]
-        d2_times = [float(r["Finish Time"]) for r in d2_rows if r.get("Finish Time")]
-
-        d1_avg = self._calculate_average_finish(d1_times) if d1_times else None
-        d2_avg = self._calculate_average_finish(d2_times) if d2_times else None
+        d1_avg = sum(d1_times) / len(d1_times) if d1_times else None
+        d2_avg = sum(d2_times) / len(d2_times) if d2_times else None
 
         winner = None
         if d1_avg and d2_avg:
@@ -76,52 +195,136 @@ class MotorsportAnalytics:
             "winner": winner,
         }
 
-    def team_performance_summary(self) -> list[dict]:
-        # Calculate each team's average finish time and number of entries
+    def team_performance_summary(self, top_n: int | None = None, bottom: bool = False) -> list[dict]:
+        # Calculate each team's average finish time and number of entries.
+        # Best (lowest) average first; with top_n only the best (or, with
+        # bottom=True, the worst) top_n teams are selected, using a heap.
+        key = ("teams", top_n, bottom)
+        if key not in self._leaderboards:
+            summary = self._team_summaries()
+            self._leaderboards[key] = self._select(summary, top_n, bottom, itemgetter("Average Finish"))
+        return [dict(entry) for entry in self._leaderboards[key]]
+
+    def get_top_drivers(self, top_n: int = 5, bottom: bool = False) -> list[tuple[str, float]]:
+        # Return the top N drivers ranked by best (lowest) average finish time,
+        # or the bottom N (worst first) when bottom=True
+        key = ("drivers", top_n, bottom)
+        if key not in self._leaderboards:
+            averages = self._driver_averages()
+            self._leaderboards[key] = self._select(averages, top_n, bottom, itemgetter(1))
+        return list(self._leaderboards[key])
+
+    @staticmethod
+    def _select(items: list, top_n: int | None, bottom: bool, key) -> list:
+        # Pick the top_n smallest (or largest) items in O(n log top_n);
+        # heapq.nsmallest is stable, so ties keep their first-seen order
+        if top_n is None:
+            return sorted(items, key=key, reverse=bottom)
+        if top_n <= 0:
+            return []
+        if bottom:
+            return heapq.nlargest(top_n, items, key=key)
+        return heapq.nsmallest(top_n, items, key=key)
+
+    def _team_summaries(self) -> list[dict]:
         team_data = defaultdict(list)
-        for r in self._rows:
-            team = str(r.get("Team", "")).strip()
-            try:
-                team_data[team].append(float(r["Finish Time"]))
-            except Exception:
-                continue
+        for team, time in zip(self._teams, self._times):
+            if time is not None:
+                team_data[team].append(time)
 
-        summary = []
-        for team, times in team_data.items():
-            avg = self._calculate_average_finish(times)
-            summary.append({
+        return [
+            {
                 "Team": team,
-                "Average Finish": round(avg, 2),
+                "Average Finish": round(sum(times) / len(times), 2),
                 "Entries": len(times),
-            })
-
-        return sorted(summary, key=lambda x: x["Average Finish"])
+            }
+            for team, times in team_data.items()
+        ]
 
-    def get_top_drivers(self, top_n: int = 5) -> list[tuple[str, float]]:
-        # Return the top N drivers ranked by best (lowest) average finish time
+    def _driver_averages(self) -> list[tuple[str, float]]:
         driver_times = defaultdict(list)
-        for r in self._rows:
-            name = str(r.get("Driver Name", "")).strip()
-            try:
-                driver_times[name].append(float(r["Finish Time"]))
-            except Exception:
+        for name, time in zip(self._names, self._times):
+            if time is not None:
+                driver_times[name].append(time)
+
+        return [(driver, sum(times) / len(times)) for driver, times in driver_times.items()]
+
+    def finish_time_sketches(
+        self, by: str = "driver", error: float = 0.01, seed: int | None = None
+    ) -> dict[str, QuantileSketch]:
+        # One mergeable quantile sketch of finish times per driver, team or
+        # circuit ("driver", "team" or "circuit"); rows without a valid time,
+        # or without a circuit when grouping by circuit, are left out
+        columns = {"driver": self._names, "team": self._teams, "circuit": self._circuits}
+        if by not in columns:
+            raise ValueError(f"Unknown grouping {by!r}; expected one of {sorted(columns)}")
+        sketches: dict[str, QuantileSketch] = {}
+        for group, time in zip(columns[by], self._times):
+            if time is None or not group:
                 continue
+            sketch = sketches.get(group)
+            if sketch is None:
+                sketch = sketches[group] = QuantileSketch(error=error, seed=seed)
+            sketch.add(time)
+        return sketches
 
-        averages = [
-            (driver, self._calculate_average_finish(times))
-            for driver, times in driver_times.items() if times
-        ]
-        return sorted(averages, key=lambda x: x[1])[:top_n]
+    def finish_time_quantiles(
+        self, by: str = "driver", quantiles: Iterable[float] = (0.5, 0.9, 0.99), error: float = 0.01
+    ) -> dict[str, dict[float, float]]:
+        # Approximate finish-time quantiles (p50/p90/p99 by default) per group
+        quantiles = tuple(quantiles)
+        return {
+            group: dict(zip(quantiles, sketch.quantiles(quantiles)))
+            for group, sketch in self.finish_time_sketches(by, error).items()
+        }
 
     def analyze_performance_trends(self, driver_name: str) -> list[tuple[str, float]]:
-        # Return a list of (date, finish_time) pairs for one driver, sorted by date
-        results = [
-            (r["Race Date"], float(r["Finish Time"]))
-            for r in self._rows
-            if r["Driver Name"].lower() == driver_name.lower()
+        # Return a list of (date, finish_time) pairs for one driver, sorted by date;
+        # rows without a valid date or finish time are left out
+        rows = self._driver_index.get(driver_name.strip().lower(), [])
+        dated = [
+            (self._dates[i], self._date_strings[i], self._times[i])
+            for i in rows
+            if self._dates[i] is not None and self._times[i] is not None
         ]
-        results.sort(key=lambda x: datetime.strptime(x[0], "%Y-%m-%d"))
-        return results
+        dated.sort(key=itemgetter(0))
+        return [(date_str, time) for _, date_str, time in dated]
+
+    def performance_trend(self, driver_name: str) -> list[TrendPoint]:
+        # Rolling trend for one driver, one TrendPoint per dated race in date order:
+        # moving average over the last trend_window races, exponentially
+        # weighted mean, change from the previous race and the current streak
+        return list(self._trend(driver_name).points)
+
+    def trend_summary(self, driver_name: str) -> dict:
+        # Latest rolling figures for one driver
+        points = self._trend(driver_name).points
+        if not points:
+            return {"races": 0, "moving_average": None, "ewma": None, "last_delta": None, "streak": 0}
+        last = points[-1]
+        return {
+            "races": len(points),
+            "moving_average": last.moving_average,
+            "ewma": last.ewma,
+            "last_delta": last.delta,
+            "streak": last.streak,
+        }
+
+    def _trend(self, driver_name: str) -> _DriverTrend:
+        key = driver_name.strip().lower()
+        trend = self._trends.get(key)
+        if trend is None:
+            trend = _DriverTrend(self._trend_window, self._trend_alpha)
+            rows = [
+                i for i in self._driver_index.get(key, [])
+                if self._dates[i] is not None and self._times[i] is not None
+            ]
+            rows.sort(key=self._dates.__getitem__)
+            for i in rows:
+                trend.add(self._dates[i], self._date_strings[i], self._times[i])
+            if rows:
+                self._trends[key] = trend
+        return trend
 
     # String Representations
     def __str__(self) -> str:
@@ -0,0 +1,394 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from heapq import merge
+from itertools import islice, repeat
+from operator import le
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .datastore import (
+    DateBound,
+    Driver,
+    RaceDataStore,
+    RaceResult,
+    ResultsView,
+    _RaceColumns,
+    _date_bounds,
+    _load_many_args,
+    _make_driver,
+    _read_race_columns,
+    _season_bounds,
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_POSITION = -1
+
+
+def _to_micros(date: datetime) -> int:
+    if date.tzinfo is not None:
+        raise ValueError(f"Columnar store only holds naive dates, got {date.isoformat()}")
+    return (date - _EPOCH) // _MICROSECOND
+
+
+def _copy_column(typecode: str, values) -> array:
+    column = array(typecode)
+    column.frombytes(memoryview(values).cast("B"))
+    return column
+
+
+class _Dictionary:
+    """Map repeated strings to small integer codes and back."""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class _RowAccessor:
+    """Index a columnar store by row number, building each RaceResult on demand."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: "ColumnarRaceDataStore"):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, row: int) -> RaceResult:
+        return self._store._row(row)
+
+
+class ColumnarRaceDataStore(RaceDataStore):
+    """
+    RaceDataStore that keeps results as typed columns instead of objects.
+
+    Dates, seasons, positions and points live in ``array`` columns and
+    race ids, circuits, teams and drivers are stored as integer codes into
+    small lookup tables, so a row costs a few dozen bytes instead of a pair
+    of dataclasses. Columns are kept in date order. The query API is the
+    same as RaceDataStore; results are turned back into RaceResult objects
+    only when a query returns them.
+    """
+
+    # column attribute -> array typecode; _dates holds microseconds since
+    # 1970-01-01 and _positions holds _NO_POSITION when a position is missing
+    COLUMNS = (
+        ("_dates", "q"),
+        ("_seasons", "i"),
+        ("_positions", "i"),
+        ("_points", "d"),
+        ("_race_codes", "I"),
+        ("_circuit_codes", "I"),
+        ("_team_codes", "I"),
+        ("_driver_codes", "I"),
+    )
+
+    def __init__(self):
+        super().__init__()
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+        # set when columns are read-only views over a mapped snapshot file
+        self._snapshot = None
+
+        self._race_ids = _Dictionary()
+        self._circuits = _Dictionary()
+        self._teams = _Dictionary()
+        self._driver_table: List[Driver] = []
+        self._driver_code_by_id: Dict[str, int] = {}
+
+        # lower-cased lookup key -> codes, code -> date-ordered row numbers
+        self._driver_keys: Dict[str, List[int]] = {}
+        self._team_keys: Dict[str, List[int]] = {}
+        self._driver_rows: Dict[int, array] = {}
+        self._team_rows: Dict[int, array] = {}
+
+    # storage
+
+    def _columns(self) -> List[array]:
+        return [getattr(self, name) for name, _ in self.COLUMNS]
+
+    def _ensure_writable(self):
+        """Copy snapshot-mapped columns into arrays before the first mutation."""
+        if self._snapshot is None:
+            return
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, _copy_column(typecode, getattr(self, name)))
+        for rows_by_code in (self._driver_rows, self._team_rows):
+            for code, rows in rows_by_code.items():
+                rows_by_code[code] = _copy_column("I", rows)
+        self._snapshot = None
+
+    def _driver_code(self, driver: Driver) -> int:
+        code = self._driver_code_by_id.get(driver.driver_id)
+        if code is None:
+            code = len(self._driver_table)
+            self._driver_code_by_id[driver.driver_id] = code
+            self._driver_table.append(self._intern_driver(driver))
+            for key in {driver.driver_id.lower(), driver.name.lower()}:
+                self._driver_keys.setdefault(key, []).append(code)
+        return code
+
+    def _team_code(self, team: str) -> int:
+        known = len(self._teams.values)
+        code = self._teams.encode(team)
+        if code == known:
+            self._team_keys.setdefault(team.lower(), []).append(code)
+        return code
+
+    def _add_results(self, batch: List[RaceResult]):
+        if not batch:
+            return
+        self._ensure_writable()
+        batch = sorted(batch, key=lambda x: x.date)
+        first_new = len(self._dates)
+        for result in batch:
+            self._dates.append(_to_micros(result.date))
+            self._seasons.append(result.season)
+            self._positions.append(_NO_POSITION if result.position is None else result.position)
+            self._points.append(result.points)
+            self._race_codes.append(self._race_ids.encode(result.race_id))
+            self._circuit_codes.append(self._circuits.encode(result.circuit))
+            self._team_codes.append(self._team_code(result.team))
+            self._driver_codes.append(self._driver_code(result.driver))
+        self._place_new_rows(first_new)
+
+    def _add_columns(self, batches: List[_RaceColumns]) -> int:
+        """
+        Append parsed race files to the columns without building any objects.
+
+        Each file's codes are translated to the store's through its short
+        lists of distinct values, the new rows are put in date order (a
+        stable sort, so equal dates keep file and row order) and then
+        merged into place like _add_results. Returns the rows added.
+        """
+        batches = [b for b in batches if len(b.date_codes)]
+        if not batches:
+            return 0
+        # convert every date first so an unsupported one leaves the store untouched
+        micros = [[_to_micros(d) for d in b.dates] for b in batches]
+        self._ensure_writable()
+        first_new = len(self._dates)
+
+        for b, dates in zip(batches, micros):
+            seasons = [d.year for d in b.dates]
+            races = [self._race_ids.encode(v) for v in b.race_ids]
+            circuits = [self._circuits.encode(v) for v in b.circuits]
+            teams = [self._team_code(v) for v in b.teams]
+            drivers = [
+                self._driver_code(_make_driver({"driver_id": name, "driver_name": name, "team": team}))
+                for name, team in zip(b.drivers, b.driver_teams)
+            ]
+            self._dates.extend(map(dates.__getitem__, b.date_codes))
+            self._seasons.extend(map(seasons.__getitem__, b.date_codes))
+            self._race_codes.extend(map(races.__getitem__, b.race_codes))
+            self._circuit_codes.extend(map(circuits.__getitem__, b.circuit_codes))
+            self._team_codes.extend(map(teams.__getitem__, b.team_codes))
+            self._driver_codes.extend(map(drivers.__getitem__, b.driver_codes))
+
+        added = len(self._dates) - first_new
+        # race files carry no positions or points (see _make_result)
+        self._positions.extend(repeat(_NO_POSITION, added))
+        self._points.extend(repeat(0.0, added))
+
+        new_dates = self._dates[first_new:]
+        if not all(map(le, new_dates, islice(new_dates, 1, None))):
+            self._sort_new_rows(first_new, new_dates)
+        self._place_new_rows(first_new)
+        return added
+
+    def _sort_new_rows(self, first_new: int, new_dates: array):
+        # stable counting sort on the few distinct dates, so the permutation
+        # is one compact array rather than a list of Python ints
+        counts = Counter(new_dates)
+        slots: Dict[int, int] = {}
+        start = first_new
+        for day in sorted(counts):
+            slots[day] = start
+            start += counts[day]
+        order = array("Q", repeat(0, len(new_dates)))
+        for row, day in enumerate(new_dates, first_new):
+            order[slots[day] - first_new] = row
+            slots[day] += 1
+        for column in self._columns():
+            column[first_new:] = array(column.typecode, map(column.__getitem__, order))
+
+    def _place_new_rows(self, first_new: int):
+        # rows from first_new on are new and date-ordered among themselves;
+        # record the change, merge them among any newer existing rows and
+        # index everything whose row number may have moved
+        earliest = self._dates[first_new]
+        self._record_change(_EPOCH + timedelta(microseconds=earliest))
+        # rows before this point are older than the whole batch and stay put
+        cut = bisect_right(self._dates, earliest, 0, first_new)
+        if cut < first_new:
+            self._merge_tail(cut, first_new)
+        self._index_rows(range(cut, len(self._dates)))
+
+    def _merge_tail(self, cut: int, first_new: int):
+        # existing rows [cut, first_new) and new rows [first_new, end) are each
+        # date-ordered, so one linear merge puts the tail back in order
+        key = self._dates.__getitem__
+        order = list(merge(range(cut, first_new), range(first_new, len(self._dates)), key=key))
+        for column in self._columns():
+            column[cut:] = array(column.typecode, map(column.__getitem__, order))
+        # row numbers from cut onwards have moved; they are re-indexed by the caller
+        for rows_by_code in (self._driver_rows, self._team_rows):
+            for rows in rows_by_code.values():
+                del rows[bisect_left(rows, cut):]
+
+    def _index_rows(self, rows: Iterable[int]):
+        for row in rows:
+            self._driver_rows.setdefault(self._driver_codes[row], array("I")).append(row)
+            self._team_rows.setdefault(self._team_codes[row], array("I")).append(row)
+
+    def _row(self, row: int) -> RaceResult:
+        position = self._positions[row]
+        return RaceResult(
+            race_id=self._race_ids.values[self._race_codes[row]],
+            date=_EPOCH + timedelta(microseconds=self._dates[row]),
+            circuit=self._circuits.values[self._circuit_codes[row]],
+            season=self._seasons[row],
+            driver=self._driver_table[self._driver_codes[row]],
+            team=self._teams.values[self._team_codes[row]],
+            position=None if position == _NO_POSITION else position,
+            points=self._points[row],
+        )
+
+    def _rows(self, rows: Iterable[int]) -> List[RaceResult]:
+        return [self._row(row) for row in rows]
+
+    def _matching_rows(self, codes: List[int], rows_by_code: Dict[int, array]) -> Iterable[int]:
+        buckets = [rows_by_code[c] for c in codes if c in rows_by_code]
+        if len(buckets) == 1:
+            return buckets[0]
+        return merge(*buckets)
+
+    # loading
+
+    def load_race_data(
+        self,
+        csv_path: str,
+        chunk_size: int = 10_000,
+        progress: Optional[Callable[[int], None]] = None,
+    ):
+        """
+        Load race results from a CSV file; see RaceDataStore.load_race_data.
+
+        Rows are encoded straight into the columns, so no RaceResult or
+        per-row Driver objects are built and peak memory stays close to
+        the size of the columns.
+        """
+        columns = _read_race_columns(csv_path, chunk_size, progress)
+        return self._add_columns([columns])
+
+    def load_many(self, csv_paths: Iterable[str], workers: Optional[int] = None) -> int:
+        """Load several CSV files like RaceDataStore.load_many, straight into the columns."""
+        paths, workers = _load_many_args(csv_paths, workers)
+        if workers == 1 or len(paths) < 2:
+            batches = [_read_race_columns(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                batches = list(pool.map(_read_race_columns, paths))
+        return self._add_columns(batches)
+
+    # query API
+
+    @classmethod
+    def load_snapshot(cls, path):
+        from .snapshot import read_snapshot
+        return read_snapshot(path, cls)
+
+    @property
+    def results(self) -> ResultsView:
+        return ResultsView(_RowAccessor(self), store=self)
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def _row_window(self, start: DateBound, end: DateBound) -> range:
+        lo, hi = _date_bounds(start, end)
+        first = 0 if lo is None else bisect_left(self._dates, _to_micros(lo))
+        stop = len(self._dates) if hi is None else bisect_right(self._dates, _to_micros(hi))
+        return range(first, max(first, stop))
+
+    def _rows_in(self, rows, window: range):
+        # rows is date-ordered, so the window is a contiguous slice of it
+        return rows[bisect_left(rows, window.start):bisect_left(rows, window.stop)]
+
+    def driver_rows(self, name_or_id: str, season: Optional[int] = None) -> array:
+        """Row numbers, in date order, for a driver id or name."""
+        codes = self._driver_keys.get(name_or_id.strip().lower(), [])
+        rows = array("I", self._matching_rows(codes, self._driver_rows))
+        if season is not None:
+            rows = self._rows_in(rows, self._row_window(*_season_bounds(season)))
+        return rows
+
+    def team_rows(self, team: str, season: Optional[int] = None) -> array:
+        """Row numbers, in date order, for a team."""
+        codes = self._team_keys.get(team.strip().lower(), [])
+        rows = array("I", self._matching_rows(codes, self._team_rows))
+        if season is not None:
+            rows = self._rows_in(rows, self._row_window(*_season_bounds(season)))
+        return rows
+
+    def results_between(
+        self,
+        start: DateBound,
+        end: DateBound,
+        driver: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> ResultsView:
+        window = self._row_window(start, end)
+        if driver is None and team is None:
+            return ResultsView(_RowAccessor(self), window, self)
+
+        if driver is not None:
+            codes = self._driver_keys.get(driver.strip().lower(), [])
+            rows_by_code = self._driver_rows
+        else:
+            codes = self._team_keys.get(team.strip().lower(), [])
+            rows_by_code = self._team_rows
+        buckets = [self._rows_in(rows_by_code[c], window) for c in codes if c in rows_by_code]
+        rows = buckets[0] if len(buckets) == 1 else array("I", merge(*buckets))
+
+        if driver is not None and team is not None:
+            wanted = set(self._team_keys.get(team.strip().lower(), []))
+            rows = array("I", (r for r in rows if self._team_codes[r] in wanted))
+        return ResultsView(_RowAccessor(self), rows, self)
+
+    def sort_races_by_date(self, ascending: bool = True):
+        rows = range(len(self._dates))
+        if not ascending:
+            # newest first but equal dates keep load order, like the stable
+            # sorted(..., reverse=True) of the object store; the rows are
+            # already in date order, so this is one linear pass for timsort
+            rows = sorted(rows, key=self._dates.__getitem__, reverse=True)
+        return self._rows(rows)
+
+    # column aggregations
+
+    def total_points(self, rows: Optional[Iterable[int]] = None) -> float:
+        """Sum the points column, optionally over a subset of row numbers."""
+        if rows is None:
+            return sum(self._points)
+        return sum(map(self._points.__getitem__, rows))
+
+    def average_position(self, rows: Optional[Iterable[int]] = None) -> float:
+        """Mean finishing position over rows that have one; 0.0 if none do."""
+        positions = self._positions if rows is None else map(self._positions.__getitem__, rows)
+        classified = [p for p in positions if p != _NO_POSITION]
+        if not classified:
+            return 0.0
+        return sum(classified) / len(classified)
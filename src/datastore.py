@@ -1,11 +1,21 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List, Dict
+from datetime import date, datetime, time, timedelta
+from collections.abc import Sequence
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, List, Dict, Tuple, Union
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from operator import attrgetter
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import os
 import csv
 from pathlib import Path
 
+from .dates import parse_race_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class Driver:
     driver_id: str
     name: str
@@ -13,7 +23,7 @@ class Driver:
     nationality: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceResult:
     race_id: str
     date: datetime
@@ -25,110 +35,511 @@ class RaceResult:
     points: float
 
 
-class RaceDataStore:
-    def __init__(self):
-        self._results: List[RaceResult] = []
+_by_date = attrgetter("date")
 
-    @property
-    def results(self):
-        return list(self._results)
-
-    def load_race_data(self, csv_path: str):
-        path = Path(csv_path)
-        if not path.exists():
-            raise FileNotFoundError("File not found")
-
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        loaded = 0
-        for row in rows:
-            # required basic fields in your CSV
-            race_id = row.get("race_id", "").strip()
-            date_str = row.get("date", "").strip()
-            circuit = row.get("circuit", "").strip()
-            driver_name = row.get("driver", "").strip()
-            team = row.get("team", "").strip()
-
-            if not race_id or not date_str or not circuit or not driver_name or not team:
-                raise ValueError(f"Missing required data: {row}")
-
-            try:
-                if len(date_str) == 10:
-                    date = datetime.strptime(date_str, "%Y-%m-%d")
-                else:
-                    date = datetime.fromisoformat(date_str)
-            except Exception:
-                raise ValueError(f"Bad date: {date_str}")
-
-            season = date.year
-            driver = self.validate_driver_data({
-                "driver_id": driver_name,     # simple default
+
+def _merge_in_date_order(target: List[RaceResult], new: List[RaceResult]):
+    """
+    Merge date-sorted ``new`` into date-sorted ``target`` in place.
+
+    When every new result is on or after the current tail this is a plain
+    append; otherwise only the part of ``target`` that overlaps the new
+    dates is merged, in linear time. Existing results stay ahead of new
+    ones with the same date.
+    """
+    if not new:
+        return
+    if not target or new[0].date >= target[-1].date:
+        target.extend(new)
+        return
+    cut = bisect_right(target, new[0].date, key=_by_date)
+    tail = target[cut:]
+    del target[cut:]
+    target.extend(merge(tail, new, key=_by_date))
+
+
+DateBound = Union[datetime, date, str, None]
+
+
+def _date_bound(value: DateBound, end: bool) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        parsed = parse_race_datetime(value.strip())
+        if len(value.strip()) != 10:
+            return parsed
+        value = parsed.date()
+    if isinstance(value, date):
+        return datetime.combine(value, time.max if end else time.min)
+    raise TypeError(f"Expected a date, datetime or 'YYYY-MM-DD' string, got {value!r}")
+
+
+def _date_bounds(start: DateBound, end: DateBound) -> Tuple[Optional[datetime], Optional[datetime]]:
+    return _date_bound(start, end=False), _date_bound(end, end=True)
+
+
+def _season_bounds(season: int) -> Tuple[datetime, datetime]:
+    return datetime(season, 1, 1), datetime.combine(datetime(season, 12, 31), time.max)
+
+
+def _with_tzinfo(bound: Optional[datetime], like: datetime) -> Optional[datetime]:
+    # stored dates may carry a UTC offset (fromisoformat keeps it); a naive
+    # bound is read in the stored dates' offset, and an aware bound against
+    # naive dates drops its offset, so the two can always be compared
+    if bound is None or (bound.tzinfo is None) == (like.tzinfo is None):
+        return bound
+    return bound.replace(tzinfo=like.tzinfo)
+
+
+def _make_driver(record: Dict) -> Driver:
+    if "driver_id" not in record or "driver_name" not in record or "team" not in record:
+        raise ValueError("Missing driver info")
+    if str(record["driver_id"]).strip() == "" or str(record["driver_name"]).strip() == "" or str(record["team"]).strip() == "":
+        raise ValueError("Driver fields cannot be empty")
+    return Driver(
+        driver_id=str(record["driver_id"]).strip(),
+        name=str(record["driver_name"]).strip(),
+        team=str(record["team"]).strip(),
+        nationality=record.get("nationality")
+    )
+
+
+def _parse_fields(row: Dict) -> Tuple[str, datetime, str, str, str]:
+    # required basic fields in your CSV
+    race_id = row.get("race_id", "").strip()
+    date_str = row.get("date", "").strip()
+    circuit = row.get("circuit", "").strip()
+    driver_name = row.get("driver", "").strip()
+    team = row.get("team", "").strip()
+
+    if not race_id or not date_str or not circuit or not driver_name or not team:
+        raise ValueError(f"Missing required data: {row}")
+
+    try:
+        date = parse_race_datetime(date_str)
+    except Exception:
+        raise ValueError(f"Bad date: {date_str}")
+    return race_id, date, circuit, driver_name, team
+
+
+def _make_result(race_id: str, date: datetime, circuit: str, driver: Driver, team: str) -> RaceResult:
+    return RaceResult(
+        race_id=race_id,
+        date=date,
+        circuit=circuit,
+        season=date.year,
+        driver=driver,
+        team=team,
+        position=None,      # not in your CSV
+        points=0.0          # not in your CSV
+    )
+
+
+def _race_rows(
+    csv_path: str,
+    chunk_size: int = 10_000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Iterator[Tuple[str, datetime, str, str, str]]:
+    """
+    Yield validated (race_id, date, circuit, driver, team) for each CSV row.
+
+    Rows are read ``chunk_size`` at a time and ``progress``, if given, is
+    called with the running row count after every chunk. A bad row raises
+    ValueError naming the file and its data row number.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            for row in chunk:
+                count += 1
+                try:
+                    yield _parse_fields(row)
+                except ValueError as exc:
+                    raise ValueError(f"{path}, row {count}: {exc}") from exc
+            if progress is not None:
+                progress(count)
+
+
+def _read_race_file(
+    csv_path: str,
+    chunk_size: int = 10_000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> List[RaceResult]:
+    """Parse and validate one race CSV into RaceResult objects."""
+    drivers: Dict[str, Driver] = {}
+    batch: List[RaceResult] = []
+    for race_id, date, circuit, driver_name, team in _race_rows(csv_path, chunk_size, progress):
+        driver = drivers.get(driver_name)
+        if driver is None:
+            driver = drivers[driver_name] = _make_driver({
+                "driver_id": driver_name,
                 "driver_name": driver_name,
                 "team": team
             })
+        batch.append(_make_result(race_id, date, circuit, driver, team))
+    return batch
+
+
+class _RaceColumns(NamedTuple):
+    """
+    One parsed race file as dictionary-encoded columns.
+
+    Each ``*_codes`` array holds, per row, an index into the matching list
+    of distinct values; drivers[i] drove for driver_teams[i] in their first
+    row. Arrays pickle as raw bytes, so sending this from a worker costs a
+    fraction of sending RaceResult objects.
+    """
+    race_ids: List[str]
+    race_codes: array
+    dates: List[datetime]
+    date_codes: array
+    circuits: List[str]
+    circuit_codes: array
+    drivers: List[str]
+    driver_teams: List[str]
+    driver_codes: array
+    teams: List[str]
+    team_codes: array
+
+
+def _read_race_columns(
+    csv_path: str,
+    chunk_size: int = 10_000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> _RaceColumns:
+    """
+    Parse and validate one race CSV into _RaceColumns.
+
+    This is module level so worker processes can run it for load_many.
+    """
+    race_index: Dict[str, int] = {}
+    date_index: Dict[datetime, int] = {}
+    circuit_index: Dict[str, int] = {}
+    driver_index: Dict[str, int] = {}
+    team_index: Dict[str, int] = {}
+    race_codes, date_codes, circuit_codes, driver_codes, team_codes = (array("I") for _ in range(5))
+    driver_teams: List[str] = []
+    for race_id, date, circuit, driver_name, team in _race_rows(csv_path, chunk_size, progress):
+        race_codes.append(race_index.setdefault(race_id, len(race_index)))
+        date_codes.append(date_index.setdefault(date, len(date_index)))
+        circuit_codes.append(circuit_index.setdefault(circuit, len(circuit_index)))
+        code = driver_index.setdefault(driver_name, len(driver_index))
+        if code == len(driver_teams):
+            driver_teams.append(team)
+        driver_codes.append(code)
+        team_codes.append(team_index.setdefault(team, len(team_index)))
+    return _RaceColumns(
+        list(race_index), race_codes,
+        list(date_index), date_codes,
+        list(circuit_index), circuit_codes,
+        list(driver_index), driver_teams, driver_codes,
+        list(team_index), team_codes,
+    )
+
+
+def _results_from_columns(columns: _RaceColumns) -> List[RaceResult]:
+    drivers = [
+        _make_driver({"driver_id": name, "driver_name": name, "team": team})
+        for name, team in zip(columns.drivers, columns.driver_teams)
+    ]
+    race_ids, dates, circuits, teams = columns.race_ids, columns.dates, columns.circuits, columns.teams
+    return [
+        _make_result(race_ids[r], dates[d], circuits[c], drivers[driver], teams[t])
+        for r, d, c, driver, t in zip(
+            columns.race_codes, columns.date_codes, columns.circuit_codes,
+            columns.driver_codes, columns.team_codes,
+        )
+    ]
+
+
+def _load_many_args(csv_paths: Iterable[str], workers: Optional[int]) -> Tuple[List[str], int]:
+    paths = [str(p) for p in csv_paths]
+    for p in paths:
+        if not Path(p).exists():
+            raise FileNotFoundError(f"File not found: {p}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return paths, workers
+
 
-            position = None     # not in your CSV
-            points = 0.0        # not in your CSV
-
-            result = RaceResult(
-                race_id=race_id,
-                date=date,
-                circuit=circuit,
-                season=season,
-                driver=driver,
-                team=driver.team,
-                position=position,
-                points=points
+class ResultsView(Sequence):
+    """
+    Read-only window onto a store's date-ordered results.
+
+    Indexing, iterating and ``len()`` go straight to the store, and slicing
+    returns another view, so nothing is copied. A view of the whole store
+    grows as more data is loaded. Any narrower view (a slice, or a date,
+    driver or team window) covers fixed row numbers, which a later load
+    can reorder, so it is only valid for the store version it was taken
+    at: using it after the store changes raises RuntimeError. Query again,
+    or copy it with list(), to keep results across loads.
+    """
+
+    __slots__ = ("_items", "_rows", "_store", "_version")
+
+    def __init__(self, items, rows: Optional[Sequence] = None, store: Optional["RaceDataStore"] = None):
+        # items: anything indexable by row number with a len(); rows: the
+        # row numbers this view covers, or None for all of them; store: the
+        # store whose version invalidates those row numbers
+        self._items = items
+        self._rows = rows
+        self._store = store
+        self._version = None if store is None else store.version
+
+    def _range(self) -> Sequence:
+        if self._rows is None:
+            return range(len(self._items))
+        if self._store is not None and self._store.version != self._version:
+            raise RuntimeError(
+                "Results view is out of date: the store has changed since it was taken"
             )
-            self._results.append(result)
-            loaded += 1
+        return self._rows
+
+    def __len__(self) -> int:
+        return len(self._range())
+
+    def __getitem__(self, index):
+        rows = self._range()
+        if isinstance(index, slice):
+            return ResultsView(self._items, rows[index], self._store)
+        return self._items[rows[index]]
+
+    def __iter__(self):
+        return map(self._items.__getitem__, self._range())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ResultsView, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ResultsView({len(self)} results)"
+
+
+class RaceDataStore:
+    def __init__(self):
+        self._results: List[RaceResult] = []
+        # secondary indexes, each list kept in date order like _results
+        self._by_driver: Dict[str, List[RaceResult]] = {}
+        self._by_team: Dict[str, List[RaceResult]] = {}
+        # one canonical Driver per driver_id, shared by all of their results
+        self._drivers: Dict[str, Driver] = {}
+        # bumped whenever results are added, so callers can tell the data changed;
+        # _change_log[v - 1] is the earliest date added by version v
+        self._version = 0
+        self._change_log: List[datetime] = []
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def changed_since(self, version: int) -> Optional[datetime]:
+        """Earliest result date added after ``version``, or None if nothing was."""
+        added = self._change_log[max(version, 0):]
+        return min(added) if added else None
+
+    def _record_change(self, earliest: datetime):
+        self._change_log.append(earliest)
+        self._version = len(self._change_log)
+
+    @property
+    def results(self) -> "ResultsView":
+        """Read-only, date-ordered view of every result; nothing is copied."""
+        return ResultsView(self._results, store=self)
 
-        self._results.sort(key=lambda x: x.date)
-        return loaded
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def load_race_data(
+        self,
+        csv_path: str,
+        chunk_size: int = 10_000,
+        progress: Optional[Callable[[int], None]] = None,
+    ):
+        """
+        Load race results from a CSV file.
+
+        Rows are read and validated ``chunk_size`` at a time straight off the
+        file handle, so the raw CSV rows never sit in memory all at once. If
+        ``progress`` is given it is called with the running row count after
+        every chunk. Nothing is added to the store unless the whole file is
+        valid.
+        """
+        batch = _read_race_file(csv_path, chunk_size, progress)
+        self._add_results(batch)
+        return len(batch)
+
+    def load_many(self, csv_paths: Iterable[str], workers: Optional[int] = None) -> int:
+        """
+        Load several CSV files, parsing them in parallel worker processes.
+
+        Each file is read and validated exactly as load_race_data would,
+        in a pool of ``workers`` processes (one per CPU by default; 1 reads
+        the files in this process). The parsed results are then merged into
+        the store in date order. If any file is missing or has a bad row,
+        the error names the file and row and nothing is added to the store.
+
+        Returns:
+            int: Total number of results loaded.
+        """
+        paths, workers = _load_many_args(csv_paths, workers)
+        if workers == 1 or len(paths) < 2:
+            batches = [_read_race_file(p) for p in paths]
+        else:
+            # workers send back compact columns; objects are built here once
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                batches = [_results_from_columns(c) for c in pool.map(_read_race_columns, paths)]
+
+        combined = [result for batch in batches for result in batch]
+        self._add_results(combined)
+        return len(combined)
+
+    def save_snapshot(self, path) -> int:
+        """
+        Save every loaded result to a binary snapshot file.
+
+        The snapshot can be opened with load_snapshot much faster than the
+        original CSV files can be re-read. Returns the number of results written.
+        """
+        from .snapshot import write_snapshot
+        return write_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """
+        Build a new store from a snapshot written by save_snapshot.
+
+        A ColumnarRaceDataStore queries the memory-mapped file directly;
+        this class rebuilds its RaceResult objects from it without any
+        CSV parsing or validation.
+        """
+        from .snapshot import read_snapshot
+        snapshot = read_snapshot(path)
+        store = cls()
+        for driver in snapshot.list_driver_profiles():
+            store._intern_driver(driver)
+        store._add_results(snapshot.results)
+        return store
+
+    def _add_results(self, batch: List[RaceResult]):
+        if not batch:
+            return
+        batch = sorted(batch, key=_by_date)
+        self._record_change(batch[0].date)
+        # new results per index bucket, still in date order
+        new_by_bucket: Dict[int, Tuple[List[RaceResult], List[RaceResult]]] = {}
+        for result in batch:
+            result.driver = self._intern_driver(result.driver)
+            for bucket in self._buckets_for(result):
+                entry = new_by_bucket.get(id(bucket))
+                if entry is None:
+                    entry = new_by_bucket[id(bucket)] = (bucket, [])
+                entry[1].append(result)
+
+        _merge_in_date_order(self._results, batch)
+        for bucket, new in new_by_bucket.values():
+            _merge_in_date_order(bucket, new)
+
+    def _intern_driver(self, driver: Driver) -> Driver:
+        return self._drivers.setdefault(driver.driver_id, driver)
+
+    def _buckets_for(self, result: RaceResult) -> List[List[RaceResult]]:
+        """Return the driver and team index buckets a result belongs in."""
+        buckets = []
+        # a driver can be looked up by id or by name, so file it under both
+        for key in {result.driver.driver_id.lower(), result.driver.name.lower()}:
+            buckets.append(self._by_driver.setdefault(key, []))
+        buckets.append(self._by_team.setdefault(result.team.lower(), []))
+        return buckets
 
     def validate_driver_data(self, record: Dict):
-        if "driver_id" not in record or "driver_name" not in record or "team" not in record:
-            raise ValueError("Missing driver info")
-        if str(record["driver_id"]).strip() == "" or str(record["driver_name"]).strip() == "" or str(record["team"]).strip() == "":
-            raise ValueError("Driver fields cannot be empty")
-        return Driver(
-            driver_id=str(record["driver_id"]).strip(),
-            name=str(record["driver_name"]).strip(),
-            team=str(record["team"]).strip(),
-            nationality=record.get("nationality")
-        )
+        """
+        Validate a driver record and return its Driver.
+
+        If a driver with the same driver_id has already been loaded, that
+        canonical instance is returned instead of a new object, so a driver
+        keeps the team and nationality they were first loaded with.
+        """
+        driver = _make_driver(record)
+        return self._drivers.get(driver.driver_id, driver)
 
     def search_driver_results(self, name_or_id: str, season: Optional[int] = None):
-        out = []
-        key = name_or_id.strip().lower()
-        for r in self._results:
-            if season is not None and r.season != season:
-                continue
-            if r.driver.driver_id.lower() == key or r.driver.name.lower() == key:
-                out.append(r)
-        return sorted(out, key=lambda x: x.date)
+        if season is None:
+            return list(self.results_between(None, None, driver=name_or_id))
+        return list(self.results_for_season(season, driver=name_or_id))
 
     def filter_by_team(self, team: str, season: Optional[int] = None):
-        out = []
-        t = team.strip().lower()
-        for r in self._results:
-            if r.team.lower() == t and (season is None or r.season == season):
-                out.append(r)
-        return sorted(out, key=lambda x: x.date)
+        if season is None:
+            return list(self.results_between(None, None, team=team))
+        return list(self.results_for_season(season, team=team))
+
+    def results_between(
+        self,
+        start: DateBound,
+        end: DateBound,
+        driver: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> ResultsView:
+        """
+        Return results dated from ``start`` to ``end``, both inclusive.
+
+        Bounds may be datetimes, dates or 'YYYY-MM-DD' strings (a date bound
+        covers that whole day) and either may be None for an open end. The
+        window is found by bisecting the date-ordered results, or the
+        driver's or team's index when ``driver`` or ``team`` is given, and
+        comes back as a view that is valid until more data is loaded (see
+        ResultsView).
+        """
+        lo, hi = _date_bounds(start, end)
+        if driver is not None:
+            source = self._by_driver.get(driver.strip().lower(), [])
+        elif team is not None:
+            source = self._by_team.get(team.strip().lower(), [])
+        else:
+            source = self._results
+        if source:
+            lo, hi = _with_tzinfo(lo, source[0].date), _with_tzinfo(hi, source[0].date)
+        first = 0 if lo is None else bisect_left(source, lo, key=_by_date)
+        stop = len(source) if hi is None else bisect_right(source, hi, key=_by_date)
+        window = ResultsView(source, range(first, max(first, stop)), self)
+        if driver is not None and team is not None:
+            wanted = team.strip().lower()
+            return ResultsView([r for r in window if r.team.lower() == wanted])
+        return window
+
+    def results_for_season(
+        self,
+        season: int,
+        driver: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> ResultsView:
+        """Return a season's results (seasons are calendar years), optionally for one driver or team."""
+        start, end = _season_bounds(season)
+        if not self._results or self._results[0].date.tzinfo is None:
+            return self.results_between(start, end, driver=driver, team=team)
+        # offset-aware dates: a result's season is the year in its own
+        # offset, which can be up to a day either side of the bounds' offset
+        day = timedelta(days=1)
+        window = self.results_between(start - day, end + day, driver=driver, team=team)
+        return ResultsView([r for r in window if r.season == season])
 
     def sort_races_by_date(self, ascending: bool = True):
         return sorted(self._results, key=lambda x: x.date, reverse=not ascending)
 
     def list_driver_profiles(self) -> List[Driver]:
-        """Return a list of unique Driver profiles from the loaded results."""
-        profiles_by_id: Dict[str, Driver] = {}
-
-        for result in self._results:
-            d = result.driver
-            # use driver_id as the key so we don't duplicate the same driver
-            if d.driver_id not in profiles_by_id:
-                profiles_by_id[d.driver_id] = d
-
-        return list(profiles_by_id.values())
+        """Return the unique Driver profiles loaded so far, in load order."""
+        return list(self._drivers.values())
@@ -0,0 +1,56 @@
+from datetime import datetime
+from functools import lru_cache
+
+# A season only has a few dozen race dates, so a small cache covers them.
+_CACHE_SIZE = 4096
+
+
+def _looks_iso(value: str) -> bool:
+    # strict zero-padded YYYY-MM-DD, the only shape fromisoformat can take
+    # on our behalf without changing what "%Y-%m-%d" accepts
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_race_date(value: str) -> datetime:
+    """
+    Parse a 'YYYY-MM-DD' string into a datetime, memoizing repeated strings.
+
+    Strict ISO strings go through datetime.fromisoformat; anything else
+    falls back to strptime so the accepted formats match "%Y-%m-%d".
+
+    Raises:
+        ValueError: If the string is not a valid date.
+
+    Examples:
+        >>> parse_race_date("2024-03-02")
+        datetime.datetime(2024, 3, 2, 0, 0)
+        >>> parse_race_date("2024-3-2")
+        datetime.datetime(2024, 3, 2, 0, 0)
+    """
+    if _looks_iso(value):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_race_datetime(value: str) -> datetime:
+    """
+    Parse a race date that may also carry a time, memoizing repeated strings.
+
+    Ten-character values are read as 'YYYY-MM-DD'; longer ones as full
+    ISO 8601 timestamps.
+
+    Raises:
+        ValueError: If the string is not a valid date or timestamp.
+    """
+    if len(value) == 10:
+        return parse_race_date(value)
+    return datetime.fromisoformat(value)
@@ -1,7 +1,7 @@
 # src/racing_library.py
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 from typing import List, Dict
 
@@ -9,6 +9,8 @@ import csv
 import json
 import os
 
+from .dates import parse_race_date
+
 
 def load_race_data(source: str | List[Dict]) -> List[Dict]:
     """
@@ -51,7 +53,7 @@ def load_race_data(source: str | List[Dict]) -> List[Dict]:
     for record in data:
         if "date" in record and record["date"] not in (None, ""):
             try:
-                record["date"] = datetime.strptime(str(record["date"]), "%Y-%m-%d").date()
+                record["date"] = parse_race_date(str(record["date"])).date()
             except Exception as exc:
                 raise ValueError(f"Invalid date format: {record['date']}") from exc
     return data
@@ -194,7 +196,7 @@ def sort_races_by_date(data: List[Dict], descending: bool = False) -> List[Dict]
             parsed = d
         else:
             try:
-                parsed = datetime.strptime(str(d), "%Y-%m-%d").date()
+                parsed = parse_race_date(str(d)).date()
             except Exception as exc:
                 raise ValueError(f"Invalid date format in record: {d}") from exc
         r["date"] = parsed
@@ -1,9 +1,16 @@
 # src/reporting.py
 from __future__ import annotations
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from .datastore import RaceDataStore
-from .analytics import RaceAnalytics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+import heapq
+import os
+import tempfile
+import uuid
+from .columnar import ColumnarRaceDataStore
+from .datastore import Driver, RaceDataStore
+from .analytics import RaceAnalytics, _summarize_driver
 
 
 
@@ -24,28 +31,66 @@ def format_race_summary(
     Returns:
       Markdown-friendly multi-line string.
     """
+    # Filter results for this race
     race_id = race.get("race_id")
+    race_results = [r for r in results if r.get("race_id") == race_id]
+    return _render_race_summary(race, race_results, drivers_by_id, top_n)
+
+
+def format_race_summaries(
+    races: Iterable[Dict[str, Any]],
+    results: Iterable[Dict[str, Any]],
+    drivers_by_id: Dict[str, Dict[str, Any]],
+    top_n: int = 10,
+) -> List[str]:
+    """
+    Build the format_race_summary text for every race in ``races``.
+
+    Results are grouped by race_id in a single pass, so a whole season
+    costs O(results) rather than one scan of ``results`` per race.
+
+    Returns:
+      One summary per race, in the order of ``races``.
+    """
+    by_race: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for r in results:
+        by_race[r.get("race_id")].append(r)
+    return [
+        _render_race_summary(race, by_race.get(race.get("race_id"), []), drivers_by_id, top_n)
+        for race in races
+    ]
+
+
+def _finish_order(r: Dict[str, Any]) -> tuple[bool, int]:
+    # DNFs (pos=None) at the end; otherwise by position ascending
+    pos = r.get("pos")
+    is_dnf = pos is None
+    pos_val = int(pos) if isinstance(pos, int) else 10**9
+    return (is_dnf, pos_val)
+
+
+def _render_race_summary(
+    race: Dict[str, Any],
+    race_results: List[Dict[str, Any]],
+    drivers_by_id: Dict[str, Dict[str, Any]],
+    top_n: int,
+) -> str:
     race_name = race.get("name", "Unknown Race")
     race_date = race.get("date", "Unknown Date")
 
-    # Filter results for this race
-    race_results = [r for r in results if r.get("race_id") == race_id]
-
     header = f"# {race_name} ({race_date})"
     if not race_results:
         return header + "\nNo results available."
 
-    # Sort: DNFs (pos=None) at the end; otherwise by position ascending
-    def sort_key(r: Dict[str, Any]) -> tuple[bool, int]:
-        pos = r.get("pos")
-        is_dnf = pos is None
-        pos_val = int(pos) if isinstance(pos, int) else 10**9
-        return (is_dnf, pos_val)
-
-    race_results.sort(key=sort_key)
+    # Only the first top_n are shown, so a heap is enough when that is a
+    # small part of the field; nsmallest is stable, like sorted()
+    if 0 <= top_n < len(race_results) // 2:
+        shown = heapq.nsmallest(top_n, race_results, key=_finish_order)
+    else:
+        shown = sorted(race_results, key=_finish_order)[:top_n]
 
     lines: List[str] = [header]
-    for r in race_results[:top_n]:
+    for r in shown:
         driver = drivers_by_id.get(r.get("driver_id", ""), {})
         driver_name = driver.get("name", "Unknown Driver")
         team_name = driver.get("team", "Unknown Team")
@@ -76,26 +121,53 @@ def generate_driver_profile(
       }
     """
     driver = drivers_by_id.get(driver_id, {})
-    driver_name = driver.get("name", "Unknown Driver")
+    profile = _new_profile(driver.get("name", "Unknown Driver"))
+    for res in all_results:
+        if res.get("driver_id") == driver_id:
+            _add_start(profile, res.get("pos"))
+    return profile
 
-    driver_results = [r for r in all_results if r.get("driver_id") == driver_id]
-    starts = len(driver_results)
 
-    finishes_with_dnfs: List[Any] = [
-        (res.get("pos") if isinstance(res.get("pos"), int) else "DNF")
-        for res in driver_results
-    ]
-    numeric_finishes = [res.get("pos") for res in driver_results if isinstance(res.get("pos"), int)]
-    podiums = sum(1 for pos in numeric_finishes if pos <= 3)
-    best_finish: Optional[int] = min(numeric_finishes) if numeric_finishes else None
-
-    return {
-        "name": driver_name,
-        "starts": starts,
-        "finishes": finishes_with_dnfs,
-        "podiums": podiums,
-        "best_finish": best_finish,
+def generate_driver_profiles(
+    all_results: Iterable[Dict[str, Any]],
+    drivers_by_id: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the generate_driver_profile summary for every driver at once.
+
+    ``all_results`` is traversed a single time, so rebuilding the whole
+    directory is linear in the number of results rather than one scan per
+    driver. Results for driver ids missing from ``drivers_by_id`` are
+    ignored.
+
+    Returns:
+      driver_id -> profile dict, in the order of ``drivers_by_id``.
+    """
+    profiles = {
+        driver_id: _new_profile(driver.get("name", "Unknown Driver"))
+        for driver_id, driver in drivers_by_id.items()
     }
+    for res in all_results:
+        profile = profiles.get(res.get("driver_id"))
+        if profile is not None:
+            _add_start(profile, res.get("pos"))
+    return profiles
+
+
+def _new_profile(name: str) -> Dict[str, Any]:
+    return {"name": name, "starts": 0, "finishes": [], "podiums": 0, "best_finish": None}
+
+
+def _add_start(profile: Dict[str, Any], pos: Any):
+    profile["starts"] += 1
+    if not isinstance(pos, int):
+        profile["finishes"].append("DNF")
+        return
+    profile["finishes"].append(pos)
+    if pos <= 3:
+        profile["podiums"] += 1
+    if profile["best_finish"] is None or pos < profile["best_finish"]:
+        profile["best_finish"] = pos
 
 
 def format_comparison_output(driver1_profile: Dict[str, Any], driver2_profile: Dict[str, Any]) -> str:
@@ -135,22 +207,98 @@ def format_comparison_output(driver1_profile: Dict[str, Any], driver2_profile: D
     return "\n".join(lines)
 
 
-def save_analysis_report(text: str, out_directory: str, filename: str = "report.md", overwrite: bool = False) -> str:
+class ReportSink:
+    """
+    Stream a report into a file that only appears once it is complete.
+
+    Chunks are written through a buffered handle to a temporary file in
+    the target's directory; commit() flushes it to disk and renames it over
+    the target with os.replace, so readers see either the old file or the
+    whole new one, never a partial report. Used as a context manager, the
+    report is committed on success and discarded if an exception escapes.
+
+    Example:
+        with ReportSink("out/season.md", overwrite=True) as sink:
+            sink.writelines(line + "\n" for line in lines)
+    """
+
+    def __init__(self, target: str | Path, overwrite: bool = False, buffer_size: int = 1 << 16):
+        self._target = Path(target)
+        if self._target.exists() and not overwrite:
+            raise FileExistsError(f"File {self._target} already exists and overwrite is False.")
+        self._tmp = self._target.with_name(f".{self._target.name}.{uuid.uuid4().hex[:12]}.tmp")
+        fd = os.open(self._tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        self._file = os.fdopen(fd, "w", encoding="utf-8", buffering=buffer_size)
+
+    @property
+    def target(self) -> Path:
+        return self._target
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, chunk: str) -> int:
+        return self._file.write(chunk)
+
+    def writelines(self, chunks: Iterable[str]) -> None:
+        # chunks are written as given; add your own line endings
+        self._file.writelines(chunks)
+
+    def commit(self) -> str:
+        """Flush the report to disk and move it into place; returns the target path."""
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._tmp, self._target)
+        except BaseException:
+            self.abort()
+            raise
+        return str(self._target)
+
+    def abort(self) -> None:
+        """Discard everything written so far and leave the target untouched."""
+        self._file.close()
+        try:
+            os.unlink(self._tmp)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "ReportSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.closed:
+            return
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+def save_analysis_report(
+    text: str | Iterable[str], out_directory: str, filename: str = "report.md", overwrite: bool = False
+) -> str:
     """
     Write 'text' into out_directory/filename. Creates the folder if missing.
 
+    'text' may be a string or an iterable of string chunks (e.g. a generator
+    of lines), which is streamed through a ReportSink so the report never
+    has to be held in memory. The target is replaced atomically.
+
     Raises:
         FileExistsError if file exists and overwrite=False.
     """
     out_path = Path(out_directory)
     out_path.mkdir(parents=True, exist_ok=True)
 
-    target = out_path / filename
-    if target.exists() and not overwrite:
-        raise FileExistsError(f"File {target} already exists and overwrite is False.")
-
-    target.write_text(text, encoding="utf-8")
-    return str(target)
+    with ReportSink(out_path / filename, overwrite=overwrite) as sink:
+        if isinstance(text, str):
+            sink.write(text)
+        else:
+            sink.writelines(text)
+    return str(sink.target)
 
 class ReportBuilder:
     """Generate formatted text reports from a RaceDataStore."""
@@ -170,36 +318,148 @@ class ReportBuilder:
         return self._analytics
 
     def driver_summary(self, name_or_id: str) -> str:
+        # fetch the driver's results once and take every figure from them
         results = self._datastore.search_driver_results(name_or_id)
         if not results:
             return f"No results found for {name_or_id}."
-        driver = results[0].driver
-        avg_finish = self._analytics.average_finish_for_driver(name_or_id)
-        total_points = self._analytics.total_points_for_driver(name_or_id)
-        race_count = len(results)
-        return (
-            f"Driver: {driver.name}\n"
-            f"Team: {driver.team}\n"
-            f"Races Recorded: {race_count}\n"
-            f"Average Finish: {avg_finish:.2f}\n"
-            f"Total Points: {total_points:.2f}\n"
-        )
+        races, total_points, avg_finish = _summarize_driver(results)
+        return _render_driver_summary(results[0].driver, races, avg_finish, total_points)
 
     def team_summary(self, team: str) -> str:
         results = self._datastore.filter_by_team(team)
         if not results:
             return f"No results found for team {team}."
-        total_points = self._analytics.total_points_for_team(team)
-        race_count = len(results)
-        return (
-            f"Team: {team}\n"
-            f"Races Recorded: {race_count}\n"
-            f"Total Points: {total_points:.2f}\n"
-        )
+        return _render_team_summary(team, len(results), sum(r.points for r in results))
+
+    def driver_summaries(self) -> Dict[str, str]:
+        """
+        Render driver_summary for every driver with results, keyed by driver_id.
+
+        All figures come from one group_by("driver") pass over the store
+        (cached until the store changes) instead of a search per driver.
+        Drivers are in the order they were first loaded.
+        """
+        stats = self._analytics.group_by("driver")
+        summaries: Dict[str, str] = {}
+        for driver in self._datastore.list_driver_profiles():
+            group = stats.get(driver.driver_id)
+            if group is not None:
+                summaries[driver.driver_id] = _render_driver_summary(
+                    driver, group.count, group.position_mean or 0.0, group.points_sum,
+                )
+        return summaries
+
+    def team_summaries(self) -> Dict[str, str]:
+        """
+        Render team_summary for every team with results; see driver_summaries.
+
+        Teams match case-insensitively, as in team_summary, and each is
+        keyed by the spelling it was first loaded with.
+        """
+        return {
+            team: _render_team_summary(team, races, points)
+            for team, (races, points) in self._team_totals().items()
+        }
+
+    def _team_totals(self) -> Dict[str, List]:
+        # fold group_by's exact-spelling groups into one entry per team
+        # name ignoring case: first-seen spelling -> [races, points]
+        totals: Dict[str, List] = {}
+        spellings: Dict[str, str] = {}
+        for team, group in self._analytics.group_by("team").items():
+            entry = totals.setdefault(spellings.setdefault(team.lower(), team), [0, 0.0])
+            entry[0] += group.count
+            entry[1] += group.points_sum
+        return totals
+
+    def render_all(self, kind: str, workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Render driver_summary or team_summary for every driver or team.
+
+        Args:
+            kind: "driver" (keyed by driver_id, in load order) or "team"
+                (keyed as in team_summaries, in order of first result).
+            workers: Worker processes (one per CPU by default; 1 renders
+                in this process).
+
+        With more than one worker the store is written once to a temporary
+        snapshot that every worker memory-maps read-only, so the data is
+        never pickled per task. Keys are handed out in contiguous chunks
+        and the results are reassembled in key order, so the output does
+        not depend on which worker finishes first.
+
+        Raises:
+            ValueError: If kind is unknown or workers is less than 1.
+        """
+        if kind not in _RENDERERS:
+            raise ValueError(f"Unknown summary kind {kind!r}; expected one of {sorted(_RENDERERS)}")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if kind == "driver":
+            keys = [d.driver_id for d in self._datastore.list_driver_profiles()]
+        else:
+            keys = list(self._team_totals())
+        if workers == 1 or len(keys) < 2:
+            return dict(zip(keys, _render_keys(self, kind, keys)))
+
+        workers = min(workers, len(keys))
+        # a few chunks per worker evens out uneven summaries without
+        # paying inter-process overhead for every key
+        size = -(-len(keys) // (workers * 4))
+        chunks = [keys[i:i + size] for i in range(0, len(keys), size)]
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = Path(tmp) / "store.snapshot"
+            self._datastore.save_snapshot(snapshot)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_render_worker, initargs=(str(snapshot),),
+            ) as pool:
+                rendered = pool.map(_render_chunk, [kind] * len(chunks), chunks)
+                texts = [text for chunk in rendered for text in chunk]
+        return dict(zip(keys, texts))
 
     def __str__(self) -> str:
-        return f"ReportBuilder(results={len(self._datastore.results)})"
+        return f"ReportBuilder(results={len(self._datastore)})"
 
     def __repr__(self) -> str:
         return f"ReportBuilder(datastore={repr(self._datastore)})"
 
+
+def _render_driver_summary(driver: Driver, races: int, avg_finish: float, total_points: float) -> str:
+    return (
+        f"Driver: {driver.name}\n"
+        f"Team: {driver.team}\n"
+        f"Races Recorded: {races}\n"
+        f"Average Finish: {avg_finish:.2f}\n"
+        f"Total Points: {total_points:.2f}\n"
+    )
+
+
+def _render_team_summary(team: str, races: int, total_points: float) -> str:
+    return (
+        f"Team: {team}\n"
+        f"Races Recorded: {races}\n"
+        f"Total Points: {total_points:.2f}\n"
+    )
+
+
+_RENDERERS = {"driver": ReportBuilder.driver_summary, "team": ReportBuilder.team_summary}
+
+# set in each render_all worker process by _init_render_worker
+_worker_builder: Optional[ReportBuilder] = None
+
+
+def _render_keys(builder: ReportBuilder, kind: str, keys: List[str]) -> List[str]:
+    render = _RENDERERS[kind]
+    return [render(builder, key) for key in keys]
+
+
+def _init_render_worker(snapshot_path: str):
+    global _worker_builder
+    _worker_builder = ReportBuilder(ColumnarRaceDataStore.load_snapshot(snapshot_path))
+
+
+def _render_chunk(kind: str, keys: List[str]) -> List[str]:
+    return _render_keys(_worker_builder, kind, keys)
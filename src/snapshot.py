@@ -0,0 +1,245 @@
+"""
+Binary snapshots of a race results store.
+
+A snapshot is a single little-endian file laid out so it can be memory
+mapped and queried without parsing:
+
+    header      magic b"RDSNAP01", uint32 format version, uint32 reserved,
+                uint64 row count
+    strings     race ids, circuits, teams, driver ids, driver names,
+                driver teams and nationalities, each as a uint64 count,
+                uint64 byte offsets (count + 1) and a UTF-8 blob
+    drivers     int32 nationality code per driver (-1 for none)
+    columns     one fixed-width column per ColumnarRaceDataStore.COLUMNS
+                entry, ``row count`` values each, in date order
+    indexes     per-driver and per-team row numbers as uint64 offsets
+                (codes + 1) followed by uint32 row numbers
+
+Every section starts on an 8-byte boundary.
+"""
+from array import array
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+import struct
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from .columnar import ColumnarRaceDataStore, _Dictionary
+from .datastore import Driver, RaceDataStore
+
+MAGIC = b"RDSNAP01"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGN = 8
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _as_columnar(store: RaceDataStore) -> ColumnarRaceDataStore:
+    if isinstance(store, ColumnarRaceDataStore):
+        return store
+    columnar = ColumnarRaceDataStore()
+    # register drivers first so the snapshot keeps the store's profile order
+    for driver in store.list_driver_profiles():
+        columnar._driver_code(driver)
+    columnar._add_results(store.results)
+    return columnar
+
+
+class _Writer:
+    def __init__(self, f):
+        self._f = f
+        self._offset = 0
+
+    def raw(self, data):
+        self._f.write(data)
+        self._offset += memoryview(data).nbytes
+
+    def pad(self):
+        gap = -self._offset % _ALIGN
+        if gap:
+            self.raw(b"\0" * gap)
+
+    def values(self, typecode: str, values):
+        # arrays and mapped snapshot columns are written as-is on
+        # little-endian machines; anything else goes through an array
+        if _LITTLE_ENDIAN and isinstance(values, (array, memoryview)):
+            self.raw(values)
+            return
+        column = array(typecode, values)
+        if not _LITTLE_ENDIAN:
+            column.byteswap()
+        self.raw(column)
+
+    def column(self, typecode: str, values):
+        self.values(typecode, values)
+        self.pad()
+
+    def strings(self, values: Sequence[str]):
+        encoded = [v.encode("utf-8") for v in values]
+        offsets = array("Q", [0])
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        self.column("Q", [len(encoded)])
+        self.column("Q", offsets)
+        self.raw(b"".join(encoded))
+        self.pad()
+
+    def index(self, rows_by_code: Dict[int, Sequence[int]], codes: int):
+        offsets = array("Q", [0])
+        for code in range(codes):
+            offsets.append(offsets[-1] + len(rows_by_code.get(code, ())))
+        self.column("Q", offsets)
+        for code in range(codes):
+            rows = rows_by_code.get(code)
+            if rows:
+                self.values("I", rows)
+        self.pad()
+
+
+class _Reader:
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+        self._offset = 0
+
+    def _advance(self, size: int) -> memoryview:
+        view = self._buffer[self._offset:self._offset + size]
+        if len(view) != size:
+            raise ValueError("Snapshot file is truncated")
+        self._offset += size
+        return view
+
+    def pad(self):
+        self._offset += -self._offset % _ALIGN
+
+    def column(self, typecode: str, count: int):
+        size = array(typecode).itemsize * count
+        view = self._advance(size)
+        self.pad()
+        if _LITTLE_ENDIAN:
+            return view.cast(typecode)
+        column = array(typecode, view.tobytes())
+        column.byteswap()
+        return column
+
+    def strings(self) -> List[str]:
+        count = self.column("Q", 1)[0]
+        offsets = self.column("Q", count + 1)
+        blob = self._advance(offsets[-1])
+        self.pad()
+        return [str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in range(count)]
+
+    def index(self, codes: int, rows: int) -> Dict[int, Sequence[int]]:
+        offsets = self.column("Q", codes + 1)
+        all_rows = self.column("I", rows)
+        return {
+            code: all_rows[offsets[code]:offsets[code + 1]]
+            for code in range(codes)
+            if offsets[code + 1] > offsets[code]
+        }
+
+
+def _dictionary(values: List[str]) -> _Dictionary:
+    table = _Dictionary()
+    for value in values:
+        table.encode(value)
+    return table
+
+
+def write_snapshot(store: RaceDataStore, path) -> int:
+    """
+    Write ``store`` to ``path`` in the snapshot format.
+
+    Returns:
+        int: Number of results written.
+    """
+    columnar = _as_columnar(store)
+    drivers = columnar._driver_table
+    nationalities = _Dictionary()
+    nationality_codes = array("i", (
+        -1 if d.nationality is None else nationalities.encode(str(d.nationality))
+        for d in drivers
+    ))
+    rows = len(columnar._dates)
+
+    with open(path, "wb") as f:
+        out = _Writer(f)
+        out.raw(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, rows))
+        out.pad()
+        out.strings(columnar._race_ids.values)
+        out.strings(columnar._circuits.values)
+        out.strings(columnar._teams.values)
+        out.strings([d.driver_id for d in drivers])
+        out.strings([d.name for d in drivers])
+        out.strings([d.team for d in drivers])
+        out.strings(nationalities.values)
+        out.column("i", nationality_codes)
+        for name, typecode in ColumnarRaceDataStore.COLUMNS:
+            out.column(typecode, getattr(columnar, name))
+        out.index(columnar._driver_rows, len(drivers))
+        out.index(columnar._team_rows, len(columnar._teams.values))
+    return rows
+
+
+def read_snapshot(path, store_cls: Optional[type] = None) -> ColumnarRaceDataStore:
+    """
+    Map a snapshot file and return a columnar store that reads from it.
+
+    Columns and index row lists are zero-copy views over the mapped file;
+    only the string tables are decoded up front. The store copies its
+    columns into ordinary arrays the first time more data is loaded into it.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a snapshot or is truncated.
+    """
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"File not found: {p}")
+    store_cls = store_cls or ColumnarRaceDataStore
+
+    with open(p, "rb") as f:
+        if p.stat().st_size < _HEADER.size:
+            raise ValueError(f"{p} is not a race data snapshot")
+        mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    magic, version, _, rows = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{p} is not a race data snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version} in {p}")
+
+    reader = _Reader(buffer)
+    reader._advance(_HEADER.size)
+    reader.pad()
+    race_ids = reader.strings()
+    circuits = reader.strings()
+    teams = reader.strings()
+    driver_ids = reader.strings()
+    names = reader.strings()
+    driver_teams = reader.strings()
+    nationalities = reader.strings()
+    nationality_codes = reader.column("i", len(driver_ids))
+
+    store = store_cls()
+    store._snapshot = mapped
+    for name, typecode in store.COLUMNS:
+        setattr(store, name, reader.column(typecode, rows))
+
+    store._race_ids = _dictionary(race_ids)
+    store._circuits = _dictionary(circuits)
+    for team in teams:
+        store._team_code(team)
+    for i, driver_id in enumerate(driver_ids):
+        code = nationality_codes[i]
+        store._driver_code(Driver(
+            driver_id=driver_id,
+            name=names[i],
+            team=driver_teams[i],
+            nationality=None if code < 0 else nationalities[code],
+        ))
+    store._driver_rows = reader.index(len(driver_ids), rows)
+    store._team_rows = reader.index(len(teams), rows)
+    if rows:
+        store._record_change(store._row(0).date)
+    return store
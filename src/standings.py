@@ -0,0 +1,182 @@
+from __future__ import annotations
+from bisect import bisect_left
+from datetime import datetime
+from typing import NamedTuple
+
+from .datastore import RaceDataStore, RaceResult, _season_bounds
+
+
+class StandingsEntry(NamedTuple):
+    position: int
+    name: str
+    points: float
+    wins: int
+
+
+class Standings(NamedTuple):
+    season: int
+    round: int          # 1-based race number within the season
+    race_id: str
+    date: datetime
+    drivers: list[StandingsEntry]
+    teams: list[StandingsEntry]
+
+
+def _table(points: dict, wins: dict, names: dict) -> list[StandingsEntry]:
+    # most points first, then most wins, then name so ties are deterministic
+    order = sorted(points, key=lambda k: (-points[k], -wins.get(k, 0), names[k]))
+    return [
+        StandingsEntry(position=i, name=names[k], points=points[k], wins=wins.get(k, 0))
+        for i, k in enumerate(order, start=1)
+    ]
+
+
+class _Season:
+    """Cumulative standings after every race of one season."""
+
+    def __init__(self, season: int):
+        self.season = season
+        self.race_ids: list[str] = []
+        self.race_dates: list[datetime] = []
+        self.race_index: dict[str, int] = {}
+        self.standings: list[Standings] = []
+        self.applied = 0    # season results already reflected in the standings
+        # running totals after the last applied race, and the totals as they
+        # stood after each race so a late result can rewind to that point
+        self._totals: list[tuple[dict, dict, dict, dict, dict, dict]] = []
+
+    def rewind(self, race: int) -> tuple[dict, dict, dict, dict, dict, dict]:
+        """Forget races from index ``race`` on and return copies of the totals before it."""
+        for race_id in self.race_ids[race:]:
+            del self.race_index[race_id]
+        del self.race_ids[race:]
+        del self.race_dates[race:]
+        del self.standings[race:]
+        del self._totals[race:]
+        if not self._totals:
+            return {}, {}, {}, {}, {}, {}
+        return tuple(dict(t) for t in self._totals[-1])
+
+    def apply(self, results: list[RaceResult], totals: tuple):
+        """Apply date-ordered results race by race on top of ``totals``."""
+        races: dict[str, list[RaceResult]] = {}
+        for r in results:
+            races.setdefault(r.race_id, []).append(r)
+
+        driver_points, driver_wins, driver_names, team_points, team_wins, team_names = totals
+        for race_id, race_results in races.items():
+            for r in race_results:
+                driver = r.driver.driver_id
+                driver_names[driver] = r.driver.name
+                driver_points[driver] = driver_points.get(driver, 0.0) + r.points
+                team_names[r.team] = r.team
+                team_points[r.team] = team_points.get(r.team, 0.0) + r.points
+                if r.position == 1:
+                    driver_wins[driver] = driver_wins.get(driver, 0) + 1
+                    team_wins[r.team] = team_wins.get(r.team, 0) + 1
+
+            self.race_index[race_id] = len(self.race_ids)
+            self.race_ids.append(race_id)
+            self.race_dates.append(race_results[0].date)
+            self._totals.append(tuple(dict(t) for t in (
+                driver_points, driver_wins, driver_names, team_points, team_wins, team_names,
+            )))
+            self.standings.append(Standings(
+                season=self.season,
+                round=len(self.race_ids),
+                race_id=race_id,
+                date=race_results[0].date,
+                drivers=_table(driver_points, driver_wins, driver_names),
+                teams=_table(team_points, team_wins, team_names),
+            ))
+
+
+class ChampionshipStandings:
+    """
+    Driver and team championship standings after every race.
+
+    Races are the distinct race_ids of a season in date order. Standings
+    after each one are computed once and stored, so looking up the table
+    after race N is a list index. When more results are loaded into the
+    store, only the races from the earliest affected one onwards are
+    re-applied, starting from the totals as they stood before it.
+    """
+
+    def __init__(self, datastore: RaceDataStore):
+        if datastore is None:
+            raise ValueError("datastore cannot be None")
+        self._datastore = datastore
+        self._seasons: dict[int, _Season] = {}
+        self._version = 0
+
+    @property
+    def datastore(self) -> RaceDataStore:
+        return self._datastore
+
+    def seasons(self) -> list[int]:
+        self._refresh()
+        return sorted(s for s, table in self._seasons.items() if table.standings)
+
+    def races(self, season: int) -> list[str]:
+        """Race ids of a season in the order they count towards the standings."""
+        self._refresh()
+        table = self._seasons.get(season)
+        return list(table.race_ids) if table else []
+
+    def after_race(self, season: int, race: int | str) -> Standings:
+        """
+        Standings after a race, given its 1-based round number or its race_id.
+
+        Raises:
+            KeyError: If the season or race is unknown.
+        """
+        self._refresh()
+        table = self._seasons.get(season)
+        if table is None or not table.standings:
+            raise KeyError(f"No races loaded for season {season}")
+        if isinstance(race, str):
+            if race not in table.race_index:
+                raise KeyError(f"No race {race!r} in season {season}")
+            return table.standings[table.race_index[race]]
+        if not 1 <= race <= len(table.standings):
+            raise KeyError(f"Season {season} has no round {race}")
+        return table.standings[race - 1]
+
+    def final(self, season: int) -> Standings:
+        """Standings after the last race loaded for a season."""
+        return self.after_race(season, len(self.races(season)))
+
+    def _refresh(self):
+        store = self._datastore
+        earliest = store.changed_since(self._version)
+        self._version = store.version
+        if earliest is None or not len(store):
+            return
+        last_season = store.results[-1].date.year
+        for season in range(earliest.year, last_season + 1):
+            self._update_season(season, earliest)
+
+    def _update_season(self, season: int, earliest: datetime):
+        store = self._datastore
+        table = self._seasons.setdefault(season, _Season(season))
+        loaded = len(store.results_for_season(season))
+        if loaded == table.applied:
+            return      # results are only ever added, so nothing changed here
+
+        _, season_end = _season_bounds(season)
+        since = earliest if earliest.year == season else datetime(season, 1, 1)
+
+        # rewind to the first race that can have changed: the first race on
+        # or after the earliest new date, or an older race that gained results
+        first = bisect_left(table.race_dates, since)
+        for r in store.results_between(since, season_end):
+            first = min(first, table.race_index.get(r.race_id, first))
+
+        resume = min(since, table.race_dates[first]) if first < len(table.race_dates) else since
+        done = set(table.race_ids[:first])
+        totals = table.rewind(first)
+        table.apply(
+            [r for r in store.results_between(resume, season_end) if r.race_id not in done],
+            totals,
+        )
+        table.applied = loaded
@@ -0,0 +1,115 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.analytics import GroupStats, RaceAnalytics
+from src.columnar import ColumnarRaceDataStore
+from src.datastore import Driver, RaceDataStore, RaceResult
+
+
+def test_aggregates_are_cached_until_the_store_changes():
+    store = RaceDataStore()
+    store.load_race_data("data/races.csv")
+    analytics = RaceAnalytics(store, cache_size=2)
+
+    assert analytics.driver_aggregate("Alice").races == 2
+    assert analytics.total_points_for_driver(" alice ") == 0.0
+    assert analytics.average_finish_for_driver("ALICE") == 0.0
+    info = analytics.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    version = store.version
+    store.load_race_data("data/races.csv")
+    assert store.version > version
+    assert analytics.driver_aggregate("Alice").races == 4
+    assert analytics.cache_info().misses == 2
+
+
+def test_aggregate_cache_evicts_least_recently_used():
+    store = RaceDataStore()
+    store.load_race_data("data/races.csv")
+    analytics = RaceAnalytics(store, cache_size=2)
+    analytics.total_points_for_team("Alpha")
+    analytics.total_points_for_team("Beta")
+    analytics.total_points_for_team("Alpha")
+    analytics.total_points_for_driver("Bob")    # evicts team Beta
+    analytics.total_points_for_team("Alpha")
+    analytics.total_points_for_team("Beta")
+    info = analytics.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
+def test_columnar_store_gives_the_same_aggregates():
+    rows, cols = RaceDataStore(), ColumnarRaceDataStore()
+    for store in (rows, cols):
+        store.load_race_data("data/races_artecia.csv")
+    for name in ("Rajah Caruth", "Dale Earnhardt", "nobody"):
+        assert RaceAnalytics(cols).driver_aggregate(name) == RaceAnalytics(rows).driver_aggregate(name)
+    assert RaceAnalytics(cols).team_aggregate("Hendrick Motorsports").races == 2
+
+
+def test_group_by_matches_per_key_queries(tmp_path):
+    csv_path = tmp_path / "season.csv"
+    lines = ["race_id,date,circuit,driver,team"]
+    lines += [f"{i},202{i % 2 + 3}-0{i % 9 + 1}-01,C{i % 4},D{i % 5},T{i % 3}" for i in range(60)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    for store in (RaceDataStore(), ColumnarRaceDataStore()):
+        store.load_race_data(str(csv_path))
+        analytics = RaceAnalytics(store)
+
+        by_team = analytics.group_by("team")
+        assert set(by_team) == {"T0", "T1", "T2"}
+        for team, stats in by_team.items():
+            assert stats.count == len(store.filter_by_team(team))
+            assert stats.points_sum == analytics.total_points_for_team(team)
+            assert stats.position_mean is None
+
+        by_driver_season = analytics.group_by("driver", "season")
+        assert by_driver_season[("D0", 2023)].count == len(store.search_driver_results("D0", season=2023))
+        assert sum(s.count for s in by_driver_season.values()) == len(store)
+        assert analytics.group_by("circuit", "team", "season", "driver")
+        assert analytics.group_by("team") is by_team
+
+
+def test_driver_stats_batch_is_json_ready():
+    store = RaceDataStore()
+    store.load_race_data("data/races_artecia.csv")
+    analytics = RaceAnalytics(store)
+    names = ["Rajah Caruth", "Dale Earnhardt", "Nobody"]
+    stats = analytics.driver_stats(names)
+
+    assert list(stats) == names
+    assert stats["Rajah Caruth"]["races"] == len(store.search_driver_results("Rajah Caruth"))
+    assert stats["Nobody"] == {"races": 0, "total_points": 0.0, "average_finish": 0.0}
+    assert json.loads(json.dumps(stats)) == stats
+    assert analytics.team_stats(["Hendrick Motorsports"])["Hendrick Motorsports"]["races"] == 2
+
+
+@pytest.mark.parametrize("store_cls", [RaceDataStore, ColumnarRaceDataStore])
+def test_group_by_position_statistics(store_cls):
+    alice, bob = Driver("alice", "Alice", "Alpha"), Driver("bob", "Bob", "Beta")
+    store = store_cls()
+    store._add_results([
+        RaceResult("r1", datetime(2024, 3, 1), "Monza", 2024, alice, "Alpha", 1, 25.0),
+        RaceResult("r1", datetime(2024, 3, 1), "Monza", 2024, bob, "Beta", 2, 18.0),
+        RaceResult("r2", datetime(2024, 4, 1), "Spa", 2024, alice, "Alpha", 3, 15.0),
+        RaceResult("r2", datetime(2024, 4, 1), "Spa", 2024, bob, "Beta", None, 0.0),
+        RaceResult("r3", datetime(2025, 3, 1), "Monza", 2025, alice, "Alpha", 4, 12.0),
+    ])
+    analytics = RaceAnalytics(store)
+
+    assert analytics.group_by("driver")["alice"] == GroupStats(
+        count=3, points_sum=52.0, points_mean=52.0 / 3, points_min=12.0, points_max=25.0,
+        positions=3, position_mean=8 / 3, position_min=1, position_max=4,
+    )
+    bob_stats = analytics.group_by("driver")["bob"]
+    assert (bob_stats.count, bob_stats.positions) == (2, 1)
+    assert (bob_stats.position_mean, bob_stats.position_min, bob_stats.position_max) == (2.0, 2, 2)
+    assert (bob_stats.points_min, bob_stats.points_max) == (0.0, 18.0)
+
+    by_circuit_season = analytics.group_by("circuit", "season")
+    assert by_circuit_season[("Monza", 2024)].position_mean == 1.5
+    assert by_circuit_season[("Monza", 2025)].position_max == 4
+    assert by_circuit_season[("Spa", 2024)].positions == 1
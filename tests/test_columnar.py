@@ -0,0 +1,131 @@
+from datetime import date, datetime
+
+from src import datastore
+from src.columnar import ColumnarRaceDataStore
+from src.datastore import RaceDataStore
+
+
+def _load(store):
+    store.load_race_data("data/races_artecia.csv")
+    store.load_race_data("data/races.csv")
+    return store
+
+
+def test_columnar_store_answers_like_the_object_store():
+    rows = _load(RaceDataStore())
+    cols = _load(ColumnarRaceDataStore())
+
+    assert cols.results == rows.results
+    assert cols.sort_races_by_date() == rows.sort_races_by_date()
+    assert cols.search_driver_results("rajah caruth") == rows.search_driver_results("rajah caruth")
+    assert cols.filter_by_team("Alpha", season=2024) == rows.filter_by_team("Alpha", season=2024)
+    assert cols.results_for_season(2024) == rows.results_for_season(2024)
+    assert cols.search_driver_results("nobody") == []
+    assert {d.driver_id for d in cols.list_driver_profiles()} == {
+        d.driver_id for d in rows.list_driver_profiles()
+    }
+
+
+def test_columnar_aggregations():
+    cols = _load(ColumnarRaceDataStore())
+    rows = cols.driver_rows("Alice")
+    assert len(rows) == 2
+    assert cols.total_points(rows) == 0.0
+    assert cols.total_points() == 0.0
+    assert cols.average_position(rows) == 0.0
+
+
+def test_out_of_order_loads_merge_into_date_order(tmp_path):
+    late = tmp_path / "late.csv"
+    early = tmp_path / "early.csv"
+    late.write_text(
+        "race_id,date,circuit,driver,team\n1,2024-05-01,Daytona,A,X\n2,2024-06-01,Daytona,B,Y\n",
+        encoding="utf-8",
+    )
+    early.write_text(
+        "race_id,date,circuit,driver,team\n3,2024-05-15,Daytona,A,X\n4,2024-01-01,Daytona,B,X\n",
+        encoding="utf-8",
+    )
+    rows, cols = RaceDataStore(), ColumnarRaceDataStore()
+    for store in (rows, cols):
+        store.load_race_data(str(late))
+        store.load_race_data(str(early))
+        store.load_race_data(str(late))
+
+    assert [r.race_id for r in rows.results] == ["4", "1", "1", "3", "2", "2"]
+    assert cols.results == rows.results
+    for name in ("A", "B"):
+        assert cols.search_driver_results(name) == rows.search_driver_results(name)
+    assert cols.filter_by_team("X") == rows.filter_by_team("X")
+
+
+def test_date_windows_match_a_filtered_scan():
+    rows = _load(RaceDataStore())
+    cols = _load(ColumnarRaceDataStore())
+    everything = rows.sort_races_by_date()
+    start, end = date(2024, 2, 1), date(2024, 3, 16)
+    expected = [r for r in everything if start <= r.date.date() <= end]
+    assert expected
+
+    for store in (rows, cols):
+        assert list(store.results_between(start, end)) == expected
+        assert list(store.results_between("2024-02-01", datetime(2024, 3, 16, 23, 0))) == expected
+        assert list(store.results_between(None, None)) == everything
+        assert list(store.results_between(end, start)) == []
+        assert list(store.results_between(start, end, driver="alice")) == [
+            r for r in expected if r.driver.name == "Alice"
+        ]
+        assert list(store.results_between(None, end, team="Hendrick Motorsports")) == [
+            r for r in everything if r.team == "Hendrick Motorsports" and r.date.date() <= end
+        ]
+        assert list(store.results_for_season(2024, driver="Rajah Caruth", team="alpha")) == []
+        assert list(store.results_for_season(2023)) == []
+
+
+def test_descending_sort_keeps_equal_dates_in_load_order(tmp_path):
+    csv_path = tmp_path / "ties.csv"
+    csv_path.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "1,2024-03-01,Monza,D1,T1\n"
+        "1,2024-03-01,Monza,D2,T2\n"
+        "2,2024-04-01,Spa,D1,T1\n"
+        "2,2024-04-01,Spa,D3,T2\n"
+        "2,2024-04-01,Spa,D2,T2\n",
+        encoding="utf-8",
+    )
+    rows, cols = RaceDataStore(), ColumnarRaceDataStore()
+    for store in (rows, cols):
+        store.load_race_data(str(csv_path))
+    newest_first = cols.sort_races_by_date(ascending=False)
+    assert newest_first == rows.sort_races_by_date(ascending=False)
+    assert [r.driver.driver_id for r in newest_first] == ["D1", "D3", "D2", "D1", "D2"]
+
+
+def test_loading_builds_no_result_objects(tmp_path, monkeypatch):
+    shuffled = tmp_path / "shuffled.csv"
+    shuffled.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "3,2024-05-01,Spa,D1,T1\n"
+        "1,2024-03-01,Monza,D2,T2\n"
+        "2,2024-04-01,Imola,D1,T1\n"
+        "1,2024-03-01,Monza,D3,T1\n",
+        encoding="utf-8",
+    )
+    expected = RaceDataStore()
+    expected.load_many([str(shuffled), "data/races.csv"], workers=1)
+
+    def no_objects(*args, **kwargs):
+        raise AssertionError("RaceResult built while loading")
+
+    monkeypatch.setattr(datastore, "RaceResult", no_objects)
+    monkeypatch.setattr(datastore, "_make_result", no_objects)
+    single, many = ColumnarRaceDataStore(), ColumnarRaceDataStore()
+    single.load_race_data(str(shuffled))
+    single.load_race_data("data/races.csv")
+    assert many.load_many([str(shuffled), "data/races.csv"], workers=1) == len(expected)
+    monkeypatch.undo()
+
+    assert single.results == expected.results
+    assert many.results == expected.results
+    dates = [r.date for r in single.results]
+    assert dates == sorted(dates)
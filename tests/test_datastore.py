@@ -1,4 +1,6 @@
+import pytest
 from pathlib import Path
+from src.columnar import ColumnarRaceDataStore
 from src.datastore import RaceDataStore
 
 def _pick():
@@ -19,3 +21,159 @@ def test_search_and_filter_do_not_crash():
     store.load_race_data(_pick())
     _ = store.search_driver_results("Rajah Caruth")
     _ = store.filter_by_team("Hendrick Motorsports")
+
+def test_indexed_lookups_match_a_full_scan():
+    store = RaceDataStore()
+    store.load_race_data("data/races_artecia.csv")
+    store.load_race_data("data/races.csv")
+    everything = store.sort_races_by_date()
+    for name in {r.driver.name for r in everything}:
+        expected = [r for r in everything if r.driver.name.lower() == name.lower()]
+        assert store.search_driver_results(name.upper()) == expected
+    for team in {r.team for r in everything}:
+        expected = [r for r in everything if r.team == team]
+        assert store.filter_by_team(f" {team} ") == expected
+    assert store.search_driver_results("Alice", season=2023) == []
+    assert len(store.results_for_season(2024)) == len(everything)
+
+def test_chunked_load_reports_progress(tmp_path):
+    csv_path = tmp_path / "big.csv"
+    lines = ["race_id,date,circuit,driver,team"]
+    lines += [f"{i},2024-01-{i % 28 + 1:02d},Daytona,Driver {i % 7},Team {i % 3}" for i in range(25)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    seen = []
+    store = RaceDataStore()
+    assert store.load_race_data(str(csv_path), chunk_size=10, progress=seen.append) == 25
+    assert seen == [10, 20, 25]
+    assert len(store.results) == 25
+
+
+def test_bad_row_leaves_store_untouched(tmp_path):
+    csv_path = tmp_path / "bad.csv"
+    csv_path.write_text(
+        "race_id,date,circuit,driver,team\n1,2024-01-01,Daytona,A,X\n2,not-a-date,Daytona,B,Y\n",
+        encoding="utf-8",
+    )
+    store = RaceDataStore()
+    with pytest.raises(ValueError):
+        store.load_race_data(str(csv_path), chunk_size=1)
+    assert store.results == []
+    assert store.search_driver_results("A") == []
+
+
+def test_results_share_one_driver_instance(tmp_path):
+    csv_path = tmp_path / "moves.csv"
+    csv_path.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "1,2024-01-01,Daytona,A,X\n"
+        "2,2024-02-01,Daytona,A,Y\n",
+        encoding="utf-8",
+    )
+    store = RaceDataStore()
+    store.load_race_data(str(csv_path))
+    store.load_race_data(str(csv_path))
+    results = store.search_driver_results("A")
+    assert len(results) == 4
+    assert all(r.driver is results[0].driver for r in results)
+    assert [r.team for r in results] == ["X", "X", "Y", "Y"]
+    assert store.list_driver_profiles() == [results[0].driver]
+    assert store.validate_driver_data({"driver_id": "A", "driver_name": "A", "team": "Z"}) is results[0].driver
+
+
+def test_load_many_matches_sequential_loads():
+    paths = ["data/races_artecia.csv", "data/races.csv"]
+    sequential = RaceDataStore()
+    for p in paths:
+        sequential.load_race_data(p)
+
+    parallel = RaceDataStore()
+    assert parallel.load_many(paths, workers=2) == len(sequential.results)
+    assert parallel.results == sequential.results
+    assert parallel.search_driver_results("Alice") == sequential.search_driver_results("Alice")
+
+
+def test_load_many_names_the_failing_file_and_row(tmp_path):
+    bad = tmp_path / "bad.csv"
+    bad.write_text(
+        "race_id,date,circuit,driver,team\n1,2024-01-01,Daytona,A,X\n2,2024-01-08,Daytona,,Y\n",
+        encoding="utf-8",
+    )
+    store = RaceDataStore()
+    with pytest.raises(ValueError, match=r"bad\.csv, row 2"):
+        store.load_many(["data/races.csv", str(bad)], workers=2)
+    assert store.results == []
+
+
+def test_results_is_a_live_read_only_view():
+    store = RaceDataStore()
+    view = store.results
+    assert len(view) == len(store) == 0
+
+    store.load_race_data("data/races.csv")
+    assert len(view) == len(store) == 3
+    assert [r.race_id for r in view] == ["2", "1", "3"]
+    assert [r.race_id for r in view[1:]] == ["1", "3"]
+    assert view[-1].race_id == "3"
+    assert view[::-1][0] is view[2]
+    with pytest.raises(TypeError):
+        view[0] = view[1]
+
+
+def test_slices_are_invalidated_by_a_load():
+    store = RaceDataStore()
+    store.load_race_data("data/races.csv")
+    whole = store.results
+    tail = whole[1:]
+    assert [r.race_id for r in tail] == ["1", "3"]
+
+    store.load_race_data("data/races.csv")
+    assert len(whole) == 6
+    with pytest.raises(RuntimeError):
+        list(tail)
+    with pytest.raises(RuntimeError):
+        tail[0]
+    assert len(whole[1:]) == 5
+
+
+def test_date_windows_do_not_follow_reordered_rows(tmp_path):
+    later = tmp_path / "later.csv"
+    later.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "may,2024-05-12,Imola,D1,T1\n"
+        "june,2024-06-09,Montreal,D1,T1\n",
+        encoding="utf-8",
+    )
+    earlier = tmp_path / "earlier.csv"
+    earlier.write_text("race_id,date,circuit,driver,team\njan,2024-01-14,Daytona,D1,T1\n", encoding="utf-8")
+
+    for store in (RaceDataStore(), ColumnarRaceDataStore()):
+        store.load_race_data(str(later))
+        may = store.results_between("2024-05-01", "2024-05-31")
+        may_for_driver = store.results_between("2024-05-01", "2024-05-31", driver="D1")
+        assert [r.race_id for r in may] == [r.race_id for r in may_for_driver] == ["may"]
+        kept = list(may)
+
+        store.load_race_data(str(earlier))
+        for stale in (may, may_for_driver):
+            with pytest.raises(RuntimeError):
+                [r.race_id for r in stale]
+        assert [r.race_id for r in kept] == ["may"]
+        assert [r.race_id for r in store.results_between("2024-05-01", "2024-05-31")] == ["may"]
+
+
+def test_season_lookups_on_offset_timestamps(tmp_path):
+    csv_path = tmp_path / "utc.csv"
+    csv_path.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "1,2024-03-01T14:00:00+00:00,Monza,A,X\n"
+        "2,2024-12-31T23:30:00-05:00,Spa,A,X\n"
+        "3,2025-01-01T00:30:00+02:00,Spa,A,X\n",
+        encoding="utf-8",
+    )
+    store = RaceDataStore()
+    store.load_race_data(str(csv_path))
+    assert [r.race_id for r in store.search_driver_results("A", season=2024)] == ["1", "2"]
+    assert [r.race_id for r in store.filter_by_team("X", season=2024)] == ["1", "2"]
+    assert [r.race_id for r in store.results_for_season(2025)] == ["3"]
+    assert [r.race_id for r in store.results_between("2024-03-01", "2024-03-01")] == ["1"]
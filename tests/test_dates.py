@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import pytest
+
+from src.dates import parse_race_date, parse_race_datetime
+
+
+def test_parse_race_date_matches_strptime():
+    for s in ["2024-03-02", "2024-3-2", "2024-12-31"]:
+        assert parse_race_date(s) == datetime.strptime(s, "%Y-%m-%d")
+
+
+def test_parse_race_date_rejects_what_strptime_rejects():
+    for s in ["20240302", "2024-02-30", "2024-03-02T10:00", "nope"]:
+        with pytest.raises(ValueError):
+            parse_race_date(s)
+
+
+def test_parse_race_datetime_accepts_timestamps():
+    assert parse_race_datetime("2024-03-02") == datetime(2024, 3, 2)
+    assert parse_race_datetime("2024-03-02T14:30:00") == datetime(2024, 3, 2, 14, 30)
+
+
+def test_repeated_dates_are_memoized():
+    parse_race_date.cache_clear()
+    first = parse_race_date("2024-05-26")
+    assert parse_race_date("2024-05-26") is first
+    assert parse_race_date.cache_info().hits == 1
@@ -0,0 +1,174 @@
+import bisect
+import random
+import statistics
+
+import pytest
+
+from src.analytics import (
+    FinishTimeStats,
+    QuantileSketch,
+    calculate_average_finish_from_file,
+    convert_finish_times,
+    is_binary_finish_times,
+    load_finish_times,
+    open_finish_times_binary,
+    stream_finish_time_sketch,
+    stream_finish_time_stats,
+)
+
+
+def test_streaming_stats_match_the_loaded_list(tmp_path):
+    path = tmp_path / "times.txt"
+    path.write_text("82.4\nDNF\n81.9\n\n83.2\n  82.0  \n", encoding="utf-8")
+    times = load_finish_times(path)
+
+    stats = stream_finish_time_stats(path, chunk_size=8)
+    assert stats.count == len(times) == 4
+    assert stats.mean == pytest.approx(statistics.fmean(times))
+    assert stats.variance == pytest.approx(statistics.pvariance(times))
+    assert stats.sample_variance == pytest.approx(statistics.variance(times))
+    assert (stats.minimum, stats.maximum) == (min(times), max(times))
+    assert calculate_average_finish_from_file(path) == pytest.approx(sum(times) / len(times))
+
+
+def test_merged_stats_equal_one_pass():
+    left, right, whole = FinishTimeStats(), FinishTimeStats(), FinishTimeStats()
+    values = [80.0, 81.5, 90.25, 79.0, 85.5, 83.0]
+    for i, v in enumerate(values):
+        (left if i < 2 else right).add(v)
+        whole.add(v)
+    merged = left.merge(right)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+    assert (merged.minimum, merged.maximum) == (79.0, 90.25)
+    assert FinishTimeStats().merge(whole).variance == pytest.approx(whole.variance)
+
+
+def test_streaming_stats_errors(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("n/a\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        stream_finish_time_stats(empty)
+    with pytest.raises(FileNotFoundError):
+        stream_finish_time_stats(tmp_path / "missing.txt")
+
+
+def test_binary_finish_times_round_trip(tmp_path):
+    text = tmp_path / "times.txt"
+    text.write_text("82.4\nDNF\n81.9\n83.2\n82.0\n", encoding="utf-8")
+    binary = tmp_path / "times.bin"
+    assert convert_finish_times(text, binary) == 4
+    assert is_binary_finish_times(binary) and not is_binary_finish_times(text)
+
+    assert list(open_finish_times_binary(binary)) == load_finish_times(text)
+    assert load_finish_times(binary) == load_finish_times(text)
+    assert calculate_average_finish_from_file(binary) == calculate_average_finish_from_file(text)
+
+    from_text, from_binary = stream_finish_time_stats(text), stream_finish_time_stats(binary)
+    assert from_binary.count == from_text.count
+    assert from_binary.mean == pytest.approx(from_text.mean)
+    assert from_binary.variance == pytest.approx(from_text.variance)
+    assert (from_binary.minimum, from_binary.maximum) == (from_text.minimum, from_text.maximum)
+
+
+def test_truncated_binary_file_is_rejected(tmp_path):
+    binary = tmp_path / "times.bin"
+    convert_finish_times("data/finish_times.txt", binary)
+    binary.write_bytes(binary.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        open_finish_times_binary(binary)
+
+
+def test_bulk_stats_over_many_blocks():
+    values = [80.0 + (i % 17) * 0.25 for i in range(10_000)]
+    bulk = FinishTimeStats.from_values(values, block=999)
+    assert bulk.count == len(values)
+    assert bulk.mean == pytest.approx(statistics.fmean(values))
+    assert bulk.variance == pytest.approx(statistics.pvariance(values))
+
+
+def _true_rank(ordered, value):
+    return bisect.bisect_right(ordered, value) / len(ordered)
+
+
+def test_quantile_sketch_stays_within_its_error_bound():
+    rng = random.Random(7)
+    values = [rng.gauss(90.0, 4.0) for _ in range(50_000)]
+    ordered = sorted(values)
+    sketch = QuantileSketch(error=0.02, seed=3)
+    sketch.update(values)
+
+    assert sketch.count == len(values)
+    assert sum(len(level) << h for h, level in enumerate(sketch._levels)) == len(values)
+    assert sum(map(len, sketch._levels)) < 1_000
+    for q, estimate in zip((0.5, 0.9, 0.99), sketch.quantiles((0.5, 0.9, 0.99))):
+        assert abs(_true_rank(ordered, estimate) - q) <= sketch.error
+    assert sketch.quantile(0) == ordered[0] and sketch.quantile(1) == ordered[-1]
+
+
+@pytest.mark.parametrize("error", [0.05, 0.01])
+def test_sketch_meets_the_configured_error_at_every_percentile(error):
+    qs = [i / 100 for i in range(1, 100)]
+    for seed in range(3):
+        rng = random.Random(seed)
+        values = [rng.random() for _ in range(100_000)]
+        ordered = sorted(values)
+        sketch = QuantileSketch(error=error, seed=seed)
+        sketch.update(values)
+        worst = max(abs(_true_rank(ordered, v) - q) for q, v in zip(qs, sketch.quantiles(qs)))
+        assert worst <= error
+
+
+def test_merged_sketches_match_one_sketch():
+    rng = random.Random(11)
+    values = [rng.uniform(70.0, 110.0) for _ in range(30_000)]
+    ordered = sorted(values)
+    parts = [QuantileSketch(seed=i) for i in range(3)]
+    for i, part in enumerate(parts):
+        part.update(values[i::3])
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+
+    assert merged.count == len(values)
+    assert (merged.minimum, merged.maximum) == (ordered[0], ordered[-1])
+    assert abs(_true_rank(ordered, merged.quantile(0.9)) - 0.9) <= merged.error
+
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(error=0.1))
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_sketch_from_text_and_binary_files(tmp_path):
+    text = tmp_path / "times.txt"
+    text.write_text("\n".join(str(80 + i % 20) for i in range(5_000)) + "\nDNF\n", encoding="utf-8")
+    binary = tmp_path / "times.bin"
+    convert_finish_times(text, binary)
+
+    from_text = stream_finish_time_sketch(text, seed=1, chunk_size=256)
+    from_binary = stream_finish_time_sketch(binary, seed=1)
+    assert from_text.count == from_binary.count == 5_000
+    assert from_text.quantiles((0.25, 0.5)) == from_binary.quantiles((0.25, 0.5))
+    assert 88 <= from_text.quantile(0.5) <= 91
+
+
+def test_binary_and_text_stats_agree_on_offset_times(tmp_path):
+    rng = random.Random(5)
+    times = [5_400_000 + rng.uniform(0.0, 2.0) for _ in range(100_000)]
+    text = tmp_path / "times.txt"
+    text.write_text("\n".join(map(repr, times)) + "\n", encoding="utf-8")
+    binary = tmp_path / "times.bin"
+    convert_finish_times(text, binary)
+
+    expected = statistics.pvariance(times)
+    assert stream_finish_time_stats(text).variance == pytest.approx(expected, rel=1e-6)
+    assert stream_finish_time_stats(binary).variance == pytest.approx(expected, rel=1e-6)
+    assert FinishTimeStats.from_values(times).variance == pytest.approx(expected, rel=1e-6)
+
+
+def test_failed_conversion_leaves_no_binary_file(tmp_path):
+    text = tmp_path / "times.txt"
+    text.write_text("DNF\nDSQ\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        convert_finish_times(text, tmp_path / "times.bin")
+    assert [p.name for p in tmp_path.iterdir()] == ["times.txt"]
@@ -0,0 +1,107 @@
+import pytest
+
+from src.car_anylitics_class import MotorsportAnalytics
+
+ROWS = [
+    ("Alice", "Alpha", "2024-03-01", "82.5"),
+    ("Bob", "Beta", "2024-03-01", "84.0"),
+    ("Cara", "Alpha", "2024-03-01", "81.0"),
+    ("Dan", "Gamma", "2024-03-01", "90.0"),
+    ("Alice", "Alpha", "2024-02-01", "83.5"),
+    ("Bob", "Beta", "2024-02-01", ""),
+    ("Cara", "Alpha", "2024-04-01", "84.0"),
+    ("Dan", "Gamma", "2024-04-01", "86.0"),
+    ("Eve", "Beta", "2024-04-01", "80.0"),
+]
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    path = tmp_path / "times.csv"
+    lines = ["Driver Name,Team,Race Date,Finish Time"] + [",".join(r) for r in ROWS]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return MotorsportAnalytics(path)
+
+
+def test_top_and_bottom_drivers(analytics):
+    full = analytics.get_top_drivers(top_n=10)
+    assert [name for name, _ in full] == ["Eve", "Cara", "Alice", "Bob", "Dan"]
+    assert analytics.get_top_drivers(top_n=2) == full[:2]
+    assert analytics.get_top_drivers(top_n=2, bottom=True) == full[::-1][:2]
+    assert analytics.get_top_drivers(top_n=0) == []
+
+
+def test_team_leaderboards(analytics):
+    full = analytics.team_performance_summary()
+    assert [t["Team"] for t in full] == ["Beta", "Alpha", "Gamma"]
+    assert analytics.team_performance_summary(top_n=1) == full[:1]
+    assert analytics.team_performance_summary(top_n=1, bottom=True) == full[-1:]
+    # callers get their own copies of cached entries
+    analytics.team_performance_summary(top_n=1)[0]["Team"] = "changed"
+    assert analytics.team_performance_summary(top_n=1) == full[:1]
+
+
+def test_compare_drivers_uses_the_driver_index(analytics):
+    result = analytics.compare_drivers("alice", " BOB ")
+    assert result["alice"] == {"average_finish": 83.0, "races": 2}
+    assert result[" BOB "] == {"average_finish": 84.0, "races": 2}
+    assert result["winner"] == "alice"
+
+
+def test_performance_trends_are_date_ordered(analytics):
+    assert analytics.analyze_performance_trends("Alice") == [("2024-02-01", 83.5), ("2024-03-01", 82.5)]
+    # Bob's February row has no finish time
+    assert analytics.analyze_performance_trends("bob") == [("2024-03-01", 84.0)]
+    assert analytics.analyze_performance_trends("nobody") == []
+
+
+def test_rolling_trend_updates_incrementally(analytics):
+    trend = analytics.performance_trend("Cara")
+    assert [(p.date, p.time) for p in trend] == [("2024-03-01", 81.0), ("2024-04-01", 84.0)]
+    assert trend[1].moving_average == pytest.approx(82.5)
+    assert trend[1].ewma == pytest.approx(0.3 * 84.0 + 0.7 * 81.0)
+    assert (trend[1].delta, trend[1].streak) == (3.0, -1)
+
+    analytics.add_results([
+        {"Driver Name": "Cara", "Team": "Alpha", "Race Date": "2024-05-01", "Finish Time": "83.0"},
+        {"Driver Name": "Cara", "Team": "Alpha", "Race Date": "2024-06-01", "Finish Time": "82.0"},
+        {"Driver Name": "Cara", "Team": "Alpha", "Race Date": "2024-07-01", "Finish Time": "n/a"},
+    ])
+    summary = analytics.trend_summary("cara")
+    assert summary["races"] == 4
+    assert summary["moving_average"] == pytest.approx((84.0 + 83.0 + 82.0) / 3)
+    assert summary["streak"] == 2
+    assert analytics.get_top_drivers(top_n=1) == [("Eve", 80.0)]
+    assert analytics.compare_drivers("Cara", "Eve")["Cara"]["races"] == 5
+
+
+def test_late_result_rebuilds_the_trend(analytics):
+    analytics.performance_trend("Alice")
+    analytics.add_results([
+        {"Driver Name": "Alice", "Team": "Alpha", "Race Date": "2024-01-01", "Finish Time": "90.0"},
+    ])
+    assert [p.time for p in analytics.performance_trend("Alice")] == [90.0, 83.5, 82.5]
+    assert analytics.trend_summary("Alice")["streak"] == 2
+    assert analytics.trend_summary("nobody")["races"] == 0
+
+
+def test_finish_time_quantiles_by_group(analytics, tmp_path):
+    by_team = analytics.finish_time_quantiles(by="team", quantiles=(0.5, 1.0))
+    assert by_team["Gamma"] == {0.5: 86.0, 1.0: 90.0}
+    assert by_team["Beta"][1.0] == 84.0
+    assert analytics.finish_time_sketches(by="driver")["Bob"].count == 1
+    # no Circuit column in this file, so there is nothing to group by
+    assert analytics.finish_time_sketches(by="circuit") == {}
+    with pytest.raises(ValueError):
+        analytics.finish_time_sketches(by="season")
+
+    path = tmp_path / "circuits.csv"
+    path.write_text(
+        "Driver Name,Team,Race Date,Finish Time,Circuit\n"
+        "Alice,Alpha,2024-03-01,82.5,Monza\n"
+        "Bob,Beta,2024-03-01,84.0,Monza\n"
+        "Alice,Alpha,2024-04-01,90.0,Spa\n",
+        encoding="utf-8",
+    )
+    circuits = MotorsportAnalytics(path).finish_time_quantiles(by="circuit", quantiles=(0.5,))
+    assert circuits == {"Monza": {0.5: 82.5}, "Spa": {0.5: 90.0}}
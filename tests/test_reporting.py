@@ -0,0 +1,140 @@
+import pytest
+
+from src.columnar import ColumnarRaceDataStore
+from src.datastore import RaceDataStore
+from src.reporting import (
+    ReportBuilder,
+    ReportSink,
+    format_race_summaries,
+    format_race_summary,
+    generate_driver_profile,
+    generate_driver_profiles,
+    save_analysis_report,
+)
+
+RACES = [
+    {"race_id": "r1", "name": "Monza", "date": "2024-09-01"},
+    {"race_id": "r2", "name": "Spa", "date": "2024-07-28"},
+    {"race_id": "r3", "name": "Imola", "date": "2024-05-19"},
+]
+DRIVERS = {
+    "d1": {"name": "Alice", "team": "Alpha"},
+    "d2": {"name": "Bob", "team": "Beta"},
+    "d3": {"name": "Cara", "team": "Alpha"},
+}
+RESULTS = [
+    {"race_id": "r1", "driver_id": "d2", "pos": 2, "best_lap": "1:21.0"},
+    {"race_id": "r2", "driver_id": "d1", "pos": None, "best_lap": None},
+    {"race_id": "r1", "driver_id": "d3", "pos": None, "best_lap": ""},
+    {"race_id": "r1", "driver_id": "d1", "pos": 1, "best_lap": "1:20.5"},
+    {"race_id": "r2", "driver_id": "d3", "pos": 1, "best_lap": "1:45.2"},
+    {"race_id": "r1", "driver_id": "d9", "pos": 3, "best_lap": "1:22.0"},
+]
+
+
+def test_bulk_race_summaries_match_single_ones():
+    for top_n in (0, 1, 2, 10):
+        expected = [format_race_summary(race, RESULTS, DRIVERS, top_n) for race in RACES]
+        assert format_race_summaries(RACES, iter(RESULTS), DRIVERS, top_n) == expected
+
+
+def test_race_summary_ordering():
+    summary = format_race_summaries(RACES[:1], RESULTS, DRIVERS, top_n=10)[0]
+    assert summary.splitlines() == [
+        "# Monza (2024-09-01)",
+        "P1 - Alice (Alpha) - Best Lap: 1:20.5",
+        "P2 - Bob (Beta) - Best Lap: 1:21.0",
+        "P3 - Unknown Driver (Unknown Team) - Best Lap: 1:22.0",
+        "DNF - Cara (Alpha) - Best Lap: N/A",
+    ]
+    assert format_race_summaries(RACES[2:], RESULTS, DRIVERS)[0].endswith("No results available.")
+
+
+def test_driver_profiles_in_one_pass():
+    drivers = dict(DRIVERS, d4={"name": "Dan", "team": "Gamma"})
+    profiles = generate_driver_profiles(iter(RESULTS), drivers)
+    assert list(profiles) == ["d1", "d2", "d3", "d4"]
+    for driver_id in drivers:
+        assert profiles[driver_id] == generate_driver_profile(driver_id, RESULTS, drivers)
+    assert profiles["d3"] == {
+        "name": "Cara", "starts": 2, "finishes": ["DNF", 1], "podiums": 1, "best_finish": 1,
+    }
+    assert profiles["d4"]["starts"] == 0 and profiles["d4"]["best_finish"] is None
+
+
+def test_bulk_summaries_match_single_ones():
+    for store in (RaceDataStore(), ColumnarRaceDataStore()):
+        store.load_race_data("data/races_artecia.csv")
+        builder = ReportBuilder(store)
+
+        drivers = builder.driver_summaries()
+        assert list(drivers) == [d.driver_id for d in store.list_driver_profiles()]
+        for driver_id, text in drivers.items():
+            assert text == builder.driver_summary(driver_id)
+
+        teams = builder.team_summaries()
+        assert teams
+        for team, text in teams.items():
+            assert text == builder.team_summary(team)
+
+
+def test_save_analysis_report_streams_and_replaces(tmp_path):
+    path = save_analysis_report((f"line {i}\n" for i in range(1000)), str(tmp_path / "out"))
+    assert (tmp_path / "out" / "report.md").read_text(encoding="utf-8").count("\n") == 1000
+    with pytest.raises(FileExistsError):
+        save_analysis_report("again", str(tmp_path / "out"))
+    assert save_analysis_report("again", str(tmp_path / "out"), overwrite=True) == path
+    assert open(path, encoding="utf-8").read() == "again"
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["report.md"]
+
+
+def test_failed_report_leaves_the_old_file(tmp_path):
+    target = tmp_path / "report.md"
+    target.write_text("old", encoding="utf-8")
+
+    def lines():
+        yield "partial\n"
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError):
+        with ReportSink(target, overwrite=True) as sink:
+            sink.writelines(lines())
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
+
+
+def test_render_all_in_worker_processes_is_deterministic():
+    store = RaceDataStore()
+    store.load_race_data("data/races_artecia.csv")
+    builder = ReportBuilder(store)
+
+    drivers = builder.render_all("driver", workers=1)
+    assert drivers == {d.driver_id: builder.driver_summary(d.driver_id) for d in store.list_driver_profiles()}
+    assert list(builder.render_all("driver", workers=3).items()) == list(drivers.items())
+    assert builder.render_all("team", workers=2) == builder.team_summaries()
+    with pytest.raises(ValueError):
+        builder.render_all("circuit")
+    with pytest.raises(ValueError):
+        builder.render_all("team", workers=0)
+
+
+def test_team_summaries_ignore_case_like_team_summary(tmp_path):
+    csv_path = tmp_path / "teams.csv"
+    csv_path.write_text(
+        "race_id,date,circuit,driver,team\n"
+        "1,2024-03-01,Monza,D1,Alpha\n"
+        "2,2024-04-01,Spa,D2,alpha\n"
+        "2,2024-04-01,Spa,D3,Beta\n",
+        encoding="utf-8",
+    )
+    for store in (RaceDataStore(), ColumnarRaceDataStore()):
+        store.load_race_data(str(csv_path))
+        builder = ReportBuilder(store)
+
+        teams = builder.team_summaries()
+        assert list(teams) == ["Alpha", "Beta"]
+        assert "Races Recorded: 2" in teams["Alpha"]
+        for team, text in teams.items():
+            assert text == builder.team_summary(team)
+        assert builder.render_all("team", workers=1) == teams
+        assert builder.render_all("team", workers=2) == teams
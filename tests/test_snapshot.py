@@ -0,0 +1,49 @@
+import pytest
+
+from src.columnar import ColumnarRaceDataStore
+from src.datastore import RaceDataStore
+
+
+def _load(store):
+    store.load_race_data("data/races_artecia.csv")
+    store.load_race_data("data/races.csv")
+    return store
+
+
+@pytest.mark.parametrize("source_cls", [RaceDataStore, ColumnarRaceDataStore])
+@pytest.mark.parametrize("target_cls", [RaceDataStore, ColumnarRaceDataStore])
+def test_snapshot_round_trip(tmp_path, source_cls, target_cls):
+    original = _load(source_cls())
+    path = tmp_path / "races.snap"
+    assert original.save_snapshot(path) == len(original.results)
+
+    restored = target_cls.load_snapshot(path)
+    assert isinstance(restored, target_cls)
+    assert restored.results == original.results
+    assert restored.search_driver_results("Rajah Caruth") == original.search_driver_results("Rajah Caruth")
+    assert restored.filter_by_team("alpha") == original.filter_by_team("alpha")
+    assert restored.list_driver_profiles() == original.list_driver_profiles()
+
+
+def test_mapped_store_accepts_more_data(tmp_path):
+    path = tmp_path / "races.snap"
+    _load(RaceDataStore()).save_snapshot(path)
+
+    restored = ColumnarRaceDataStore.load_snapshot(path)
+    restored.load_race_data("data/races.csv")
+    expected = _load(RaceDataStore())
+    expected.load_race_data("data/races.csv")
+    assert restored.results == expected.results
+    assert restored.search_driver_results("Alice") == expected.search_driver_results("Alice")
+
+    # a store loaded from a snapshot can itself be snapshotted again
+    again = tmp_path / "again.snap"
+    ColumnarRaceDataStore.load_snapshot(path).save_snapshot(again)
+    assert RaceDataStore.load_snapshot(again).results == _load(RaceDataStore()).results
+
+
+def test_load_snapshot_rejects_other_files(tmp_path):
+    with pytest.raises(ValueError):
+        RaceDataStore.load_snapshot("data/races.csv")
+    with pytest.raises(FileNotFoundError):
+        RaceDataStore.load_snapshot(tmp_path / "missing.snap")
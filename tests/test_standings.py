@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+
+from src.analytics import RaceAnalytics
+from src.columnar import ColumnarRaceDataStore
+from src.datastore import Driver, RaceDataStore, RaceResult
+
+ALICE = Driver("alice", "Alice", "Alpha")
+BOB = Driver("bob", "Bob", "Beta")
+CARA = Driver("cara", "Cara", "Alpha")
+
+
+def _race(race_id, day, finishing_order, month=3, year=2024):
+    points = [25.0, 18.0, 15.0]
+    return [
+        RaceResult(race_id, datetime(year, month, day), "Track", year, d, d.team, i + 1, points[i])
+        for i, d in enumerate(finishing_order)
+    ]
+
+
+def _points(standings):
+    return {e.name: e.points for e in standings.drivers}
+
+
+@pytest.mark.parametrize("store_cls", [RaceDataStore, ColumnarRaceDataStore])
+def test_standings_after_each_race(store_cls):
+    store = store_cls()
+    store._add_results(_race("r1", 1, [ALICE, BOB, CARA]) + _race("r2", 8, [BOB, CARA, ALICE]))
+    standings = RaceAnalytics(store).standings
+
+    assert standings.races(2024) == ["r1", "r2"]
+    after_one = standings.after_race(2024, 1)
+    assert [e.name for e in after_one.drivers] == ["Alice", "Bob", "Cara"]
+    assert [(e.name, e.points) for e in after_one.teams] == [("Alpha", 40.0), ("Beta", 18.0)]
+    assert _points(standings.after_race(2024, "r2")) == {"Alice": 40.0, "Bob": 43.0, "Cara": 33.0}
+    final = standings.final(2024)
+    assert [(e.position, e.name, e.wins) for e in final.drivers] == [(1, "Bob", 1), (2, "Alice", 1), (3, "Cara", 0)]
+    assert {e.name: e.points for e in final.teams} == {"Alpha": 73.0, "Beta": 43.0}
+
+    with pytest.raises(KeyError):
+        standings.after_race(2024, 3)
+    with pytest.raises(KeyError):
+        standings.after_race(2023, 1)
+
+
+@pytest.mark.parametrize("store_cls", [RaceDataStore, ColumnarRaceDataStore])
+def test_new_results_are_applied_as_deltas(store_cls):
+    store = store_cls()
+    store._add_results(_race("r1", 1, [ALICE, BOB]) + _race("r3", 15, [ALICE, BOB]))
+    standings = RaceAnalytics(store).standings
+    first_round = standings.after_race(2024, 1)
+
+    # a later race only appends a round
+    store._add_results(_race("r4", 22, [BOB, ALICE]))
+    assert standings.races(2024) == ["r1", "r3", "r4"]
+    assert standings.after_race(2024, 1) is first_round
+
+    # a race that happened earlier slots in and the later rounds are redone
+    store._add_results(_race("r2", 8, [CARA, BOB]))
+    assert standings.races(2024) == ["r1", "r2", "r3", "r4"]
+    assert _points(standings.after_race(2024, "r2")) == {"Alice": 25.0, "Bob": 36.0, "Cara": 25.0}
+    assert _points(standings.final(2024)) == {"Alice": 68.0, "Bob": 79.0, "Cara": 25.0}
+
+    # late results for an existing race are folded into that race
+    store._add_results([RaceResult("r1", datetime(2024, 3, 1), "Track", 2024, CARA, "Alpha", 3, 15.0)])
+    assert _points(standings.after_race(2024, "r1")) == {"Alice": 25.0, "Bob": 18.0, "Cara": 15.0}
+
+    # another season does not disturb this one
+    store._add_results(_race("n1", 1, [CARA, ALICE], month=1, year=2025))
+    assert standings.seasons() == [2024, 2025]
+    assert _points(standings.final(2025)) == {"Cara": 25.0, "Alice": 18.0}
+    assert _points(standings.final(2024))["Cara"] == 40.0